@@ -13,6 +13,7 @@ class Atomic(ABC):
     Atomic elements are the fundamental building blocks that cannot be broken down further.
     e.g. atomic propositions, predicates, terms, and symbols.
     """
+    __slots__ = ()
 
     @abstractmethod
     def __str__(self) -> str:
@@ -16,6 +16,7 @@ class Compound(ABC, t.Generic[T]):
     This pattern appears throughout formal logic - in propositions, predicates,
     terms, and other constructs.
     """
+    __slots__ = ()
 
     @property
     @abstractmethod
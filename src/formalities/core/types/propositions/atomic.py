@@ -6,7 +6,7 @@ from formalities.core.types.logic import LogicType
 from formalities.core.types.atomic import Atomic, AtomicRegistry
 from formalities.core.types.propositions.base import Proposition
 
-@dataclass(frozen=True, eq=False)
+@dataclass(frozen=True, eq=False, slots=True, weakref_slot=True)
 class AtomicProposition(Proposition, Atomic):
     """
     Represents an atomic (indivisible) proposition
@@ -14,6 +14,7 @@ class Proposition(ABC):
     A proposition is a statement that is either true or false. <- hint (bool return at evaluation)
     All proposition types must inherit from this base class.
     """
+    __slots__ = ()
 
     @abstractmethod
     def evaluate(self, *args, **kwargs) -> bool:
@@ -8,7 +8,7 @@ from formalities.core.types.propositions.base import Proposition
 from formalities.core.types.operators.base import Operator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class CompoundProposition(Proposition, Compound[Proposition]):
     """
     A proposition composed of other propositions combined by a logical operator.
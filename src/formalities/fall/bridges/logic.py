@@ -26,6 +26,9 @@ class LogicBridge:
             "IFF": IFF()
         }
         self._propositions = {}
+        self._parsecache: dict[str, Proposition] = {}
+        # Bumped whenever the registered propositions change
+        self.generation = 0
         self._nlpbridge = None
 
     @property
@@ -67,6 +70,8 @@ class LogicBridge:
         """Create an atomic proposition and register it."""
         prop = AtomicProposition(name, _truthvalue=value)
         self._propositions[name] = prop
+        self._parsecache.clear()
+        self.generation += 1
         return prop
 
     def createcompound(self, operatorname: str, *props) -> Proposition:
@@ -80,7 +85,17 @@ class LogicBridge:
     def parseexpression(self, expr: str) -> Proposition:
         """
         Parse a FALL expression into a Formalities proposition, logging input and parsed result.
+
+        Results are cached per expression string until a proposition is created or registered.
         """
+        if (cached := self._parsecache.get(expr)) is not None:
+            return cached
+        prop = self._parseexpression(expr)
+        self._parsecache[expr] = prop
+        return prop
+
+    def _parseexpression(self, expr: str) -> Proposition:
+        """Parse a FALL expression without consulting the cache."""
         log.debug(f"Parsing expression: {expr}")
         tokens = expr.strip().split()
 
@@ -149,11 +164,18 @@ class LogicBridge:
     def registerprop(self, name: str, prop: Proposition) -> None:
         """Register an existing proposition with a name."""
         self._propositions[name] = prop
+        self._parsecache.clear()
+        self.generation += 1
 
     def getprop(self, name: str) -> t.Optional[Proposition]:
         """Get a proposition by name."""
         return self._propositions.get(name)
 
+    def getprops(self, names: t.Iterable[str]) -> dict[str, Proposition]:
+        """Get the registered propositions among names; missing names are left out."""
+        propositions = self._propositions
+        return {name: prop for name in names if (prop := propositions.get(name)) is not None}
+
     def isconsistent(self, *props: Proposition) -> bool:
         """
         Check if a set of propositions is consistent, logging the results.
@@ -1,7 +1,12 @@
 # ~/formalities/src/formalities/fall/grammar/keywords.py
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
+
+class TokenType(IntEnum):
+    # Integer-valued so token type checks compare as plain ints,
+    # while keeping the 'TokenType.NAME' rendering in parse errors
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
-class TokenType(Enum):
     # Keywords
     DEFINE = auto()
     RULE = auto()
@@ -1,18 +1,46 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 class Node(ABC):
     """Base class for all AST nodes."""
+    __slots__ = ()
 
-    @abstractmethod
     def accept(self, visitor):
         """Accept a visitor to process this node."""
-        pass
+        return visitor.dispatch(self)
 
 class Visitor(ABC):
     """Base visitor interface for AST traversal."""
 
+    _HANDLERS: Dict[type, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Build the node type -> visit method table once per visitor class."""
+        super().__init_subclass__(**kwargs)
+        cls._HANDLERS = {
+            nodetype: getattr(cls, methodname)
+            for nodetype, methodname in VISITMETHODS.items()
+            if hasattr(cls, methodname)
+        }
+
+    def dispatch(self, node):
+        """Visit a node via the handler table."""
+        try:
+            handler = self._HANDLERS[type(node)]
+        except KeyError:
+            handler = self._resolvehandler(type(node))
+        return handler(self, node)
+
+    @classmethod
+    def _resolvehandler(cls, nodetype: type):
+        """Resolve a handler for a node subclass and cache it."""
+        for base in nodetype.__mro__[1:]:
+            if base in cls._HANDLERS:
+                cls._HANDLERS[nodetype] = cls._HANDLERS[base]
+                return cls._HANDLERS[base]
+        raise TypeError(f"{cls.__name__} has no handler for {nodetype.__name__}")
+
     @abstractmethod
     def visitruledef(self, node):
         pass
@@ -37,62 +65,53 @@ class Visitor(ABC):
     def visitquery(self, node):
         pass
 
-@dataclass
+@dataclass(slots=True)
 class Condition(Node):
     """A condition in a rule or axiom definition."""
     expression: str
 
-    def accept(self, visitor):
-        return visitor.visitcondition(self)
-
-@dataclass
+@dataclass(slots=True)
 class RuleDefinition(Node):
     """Definition of a grammatical rule."""
     name: str
     conditions: List[Condition]
 
-    def accept(self, visitor):
-        return visitor.visitruledef(self)
-
-@dataclass
+@dataclass(slots=True)
 class AxiomDefinition(Node):
     """Definition of a logical axiom."""
     name: str
     conditions: List[Condition]
 
-    def accept(self, visitor):
-        return visitor.visitaxiomdef(self)
-
-@dataclass
+@dataclass(slots=True)
 class PropositionDefinition(Node):
     """Definition of a proposition from natural language."""
     name: str
     text: str
     structure: Dict[str, Any]
 
-    def accept(self, visitor):
-        return visitor.visitpropdef(self)
-
-@dataclass
+@dataclass(slots=True)
 class Assertion(Node):
     """Logical assertion between propositions."""
     expression: str
 
-    def accept(self, visitor):
-        return visitor.visitassertion(self)
+# Proof step kinds, resolved from the step action once at construction
+ASSERTSTEP, INFERSTEP, UNKNOWNSTEP = 0, 1, -1
+STEPKINDS = {"ASSERT": ASSERTSTEP, "INFER": INFERSTEP}
 
-@dataclass
+@dataclass(slots=True)
 class ProofStep(Node):
     """A step in a proof process."""
     number: int
     action: str
+    expr: str = ""
     source: Optional[List[str]] = None
     via: Optional[str] = None
+    kind: int = field(init=False, repr=False, compare=False)
 
-    def accept(self, visitor):
-        return visitor.visitproofstep(self)
+    def __post_init__(self):
+        self.kind = STEPKINDS.get(self.action, UNKNOWNSTEP)
 
-@dataclass
+@dataclass(slots=True)
 class Proof(Node):
     """A complete proof process."""
     given: List[str]
@@ -100,21 +119,25 @@ class Proof(Node):
     using: List[str]
     steps: List[ProofStep]
 
-    def accept(self, visitor):
-        return visitor.visitproof(self)
-
-@dataclass
+@dataclass(slots=True)
 class Query(Node):
     """A query to the knowledge base."""
     proposition: str
 
-    def accept(self, visitor):
-        return visitor.visitquery(self)
-
-@dataclass
+@dataclass(slots=True)
 class Program(Node):
     """The root node of a FALL program."""
     statements: List[Node]
 
-    def accept(self, visitor):
-        return visitor.visitprogram(self)
+# Map of AST node types to visitor method names
+VISITMETHODS = {
+    Condition: 'visitcondition',
+    RuleDefinition: 'visitruledef',
+    AxiomDefinition: 'visitaxiomdef',
+    PropositionDefinition: 'visitpropdef',
+    Assertion: 'visitassertion',
+    ProofStep: 'visitproofstep',
+    Proof: 'visitproof',
+    Query: 'visitquery',
+    Program: 'visitprogram',
+}
@@ -1,5 +1,5 @@
 # ~/formalities/src/formalities/fall/parser/lexing.py
-import typing as t
+import sys, typing as t
 from dataclasses import dataclass
 from formalities.fall.grammar.keywords import TokenType, KEYWORDS
 
@@ -11,39 +11,74 @@ class Token:
     column: int
     value: t.Optional[object] = None
 
+# Code points the scanner compares against
+NUL = 0
+TAB = ord('\t')
+NEWLINE = ord('\n')
+CR = ord('\r')
+SPACE = ord(' ')
+QUOTE = ord('"')
+DOT = ord('.')
+COLON = ord(':')
+
+# Character class bits for the ASCII range
+ALPHA = 1
+DIGIT = 2
+ALNUM = ALPHA | DIGIT
+
+CHARCLASS = bytearray(128)
+for _code in range(128):
+    _char = chr(_code)
+    if _char.isalpha() or _char == '_':
+        CHARCLASS[_code] |= ALPHA
+    if _char.isdigit():
+        CHARCLASS[_code] |= DIGIT
+del _code, _char
+
+# Single-character tokens, keyed by code point
+CHARTOKENS = {
+    ord('('): TokenType.LPAREN,
+    ord(')'): TokenType.RPAREN,
+    ord('['): TokenType.LBRACKET,
+    ord(']'): TokenType.RBRACKET,
+    ord(','): TokenType.COMMA,
+    ord('*'): TokenType.ASTERISK,
+    ord('|'): TokenType.PIPE,
+}
+
+# Two-character tokens
+DOUBLECHARTOKENS = {
+    '->': TokenType.ARROW,
+    '::': TokenType.DOUBLECOLON,
+    '//': TokenType.EOL,
+    '!-': TokenType.COMMENT,
+}
+
+UTF32 = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+def encodesource(source: str) -> t.Sequence[int]:
+    """Encode source so that indexing yields one int code point per character."""
+    if source.isascii():
+        return source.encode('ascii')
+    return memoryview(source.encode(UTF32)).cast('I')
+
 class Lexer:
     def __init__(self, source: str):
         self.source = source
+        self.buf = encodesource(source)
         self.tokens: t.List[Token] = []
         self.start = 0
+        self.startcolumn = 1
         self.current = 0
         self.line = 1
         self.column = 1
 
-        # Define token patterns for single-character tokens
-        self.char_tokens = {
-            '(': TokenType.LPAREN,
-            ')': TokenType.RPAREN,
-            '[': TokenType.LBRACKET,
-            ']': TokenType.RBRACKET,
-            ',': TokenType.COMMA,
-            '*': TokenType.ASTERISK,
-            '|': TokenType.PIPE,
-        }
-
-        # Define token patterns for two-character tokens
-        self.double_char_tokens = {
-            '->': TokenType.ARROW,
-            '::': TokenType.DOUBLECOLON,
-            '//': TokenType.EOL,
-            '!-': TokenType.COMMENT,
-        }
-
     def scantokens(self) -> t.List[Token]:
         """Scan the source code and return a list of tokens."""
         while not self._reachedend():
             # Beginning of the next lexeme
             self.start = self.current
+            self.startcolumn = self.column
             self._scantoken()
 
         self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
@@ -54,43 +89,43 @@ class Lexer:
         c = self._advance()
 
         # Check for single character tokens first
-        if c in self.char_tokens:
-            self._addtoken(self.char_tokens[c])
+        if c in CHARTOKENS:
+            self._addtoken(CHARTOKENS[c])
             return
 
         # Check for potential double character tokens
-        if self.current < len(self.source):
-            double_char = c + self._peek()
-            if double_char in self.double_char_tokens:
+        if self.current < len(self.buf):
+            double_char = self.source[self.start:self.current + 1]
+            if double_char in DOUBLECHARTOKENS:
                 self._advance()  # Consume the second character
-                token_type = self.double_char_tokens[double_char]
+                token_type = DOUBLECHARTOKENS[double_char]
 
                 # Special handling for comments
                 if token_type == TokenType.COMMENT:
                     # Comment goes until the end of the line or file
-                    while self._peek() != '\n' and not self._reachedend():
+                    while self._peek() != NEWLINE and not self._reachedend():
                         self._advance()
 
                 self._addtoken(token_type)
                 return
 
         # Handle whitespace
-        if c in [' ', '\t', '\r']:
+        if c == SPACE or c == TAB or c == CR:
             # Ignore whitespace
             return
-        elif c == '\n':
+        elif c == NEWLINE:
             self.line += 1
             self.column = 0
             self._addtoken(TokenType.EOL)
             return
 
         # Handle other single character tokens that need special logic
-        if c == ':':
+        if c == COLON:
             self._addtoken(TokenType.COLON)
             return
 
         # Handle string literals
-        if c == '"':
+        if c == QUOTE:
             self._string()
             return
 
@@ -105,12 +140,12 @@ class Lexer:
             return
 
         # If we get here, the character wasn't recognized
-        self._addtoken(TokenType.ERROR, f"Unexpected character: '{c}'")
+        self._addtoken(TokenType.ERROR, f"Unexpected character: '{chr(c)}'")
 
     def _string(self) -> None:
         """Process a string literal."""
-        while self._peek() != '"' and not self._reachedend():
-            if self._peek() == '\n':
+        while self._peek() != QUOTE and not self._reachedend():
+            if self._peek() == NEWLINE:
                 self.line += 1
                 self.column = 0
             self._advance()
@@ -131,9 +166,10 @@ class Lexer:
         while not self._reachedend() and self._isalphanumeric(self._peek()):
             self._advance()
 
-        text = self.source[self.start:self.current]
+        # Interned so names used as dict keys downstream hash and compare by identity
+        text = sys.intern(self.source[self.start:self.current])
         type = KEYWORDS.get(text.upper(), TokenType.IDENTIFIER)
-        self._addtoken(type)
+        self._addtoken(type, text=text)
 
     def _number(self) -> None:
         """Process a number literal."""
@@ -141,47 +177,57 @@ class Lexer:
             self._advance()
 
         # Look for a decimal part
-        if not self._reachedend() and self._peek() == '.' and not self._reachedend(self.current + 1) and self._isdigit(self._peeknext()):
+        hasdot = False
+        if not self._reachedend() and self._peek() == DOT and not self._reachedend(self.current + 1) and self._isdigit(self._peeknext()):
             # Consume the "."
             self._advance()
+            hasdot = True
 
             while not self._reachedend() and self._isdigit(self._peek()):
                 self._advance()
 
-        value = float(self.source[self.start:self.current])
+        text = self.source[self.start:self.current]
+        value = float(text) if hasdot else int(text)
         self._addtoken(TokenType.NUMBER, value)
 
     def _reachedend(self, pos: t.Optional[int] = None) -> bool:
         """Check if we've reached the end of the source at the given position (or current position if None)."""
         if pos is None:
             pos = self.current
-        return (pos >= len(self.source))
+        return (pos >= len(self.buf))
 
-    def _isalpha(self, c: str) -> bool:
-        return (c.isalpha() or c == '_')
+    def _isalpha(self, c: int) -> bool:
+        if c < 128:
+            return bool(CHARCLASS[c] & ALPHA)
+        return chr(c).isalpha()
 
-    def _isalphanumeric(self, c: str) -> bool:
-        return (c.isalnum() or c == '_')
+    def _isalphanumeric(self, c: int) -> bool:
+        if c < 128:
+            return bool(CHARCLASS[c] & ALNUM)
+        return chr(c).isalnum()
 
-    def _isdigit(self, c: str) -> bool:
-        return c.isdigit()
+    def _isdigit(self, c: int) -> bool:
+        if c < 128:
+            return bool(CHARCLASS[c] & DIGIT)
+        return chr(c).isdigit()
 
-    def _addtoken(self, type: TokenType, literal: t.Optional[object] = None) -> None:
-        text = self.source[self.start:self.current]
-        self.tokens.append(Token(type, text, self.line, (self.column - (self.current - self.start)), literal))
+    def _addtoken(self, type: TokenType, literal: t.Optional[object] = None, text: t.Optional[str] = None) -> None:
+        if text is None:
+            text = self.source[self.start:self.current]
+        self.tokens.append(Token(type, text, self.line, self.startcolumn, literal))
 
-    def _peek(self) -> str:
+    def _peek(self) -> int:
         if self._reachedend():
-            return '\0'
-        return self.source[self.current]
+            return NUL
+        return self.buf[self.current]
 
-    def _peeknext(self) -> str:
+    def _peeknext(self) -> int:
         if self._reachedend(self.current + 1):
-            return '\0'
-        return self.source[self.current + 1]
+            return NUL
+        return self.buf[self.current + 1]
 
-    def _advance(self) -> str:
-        c = self.source[self.current]
+    def _advance(self) -> int:
+        c = self.buf[self.current]
         self.current += 1
         self.column += 1
         return c
@@ -189,7 +235,7 @@ class Lexer:
     def _match(self, expected: str) -> bool:
         if self._reachedend():
             return False
-        if self.source[self.current] != expected:
+        if self.buf[self.current] != ord(expected):
             return False
         self.current += 1
         self.column += 1
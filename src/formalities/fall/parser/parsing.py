@@ -15,6 +15,14 @@ class ParseError(Exception):
     pass
 
 class Parser:
+    # Token types that start a new statement, used for error recovery
+    _SYNCTARGETS = frozenset({
+        TokenType.DEFINE,
+        TokenType.ASSERT,
+        TokenType.BEGIN,
+        TokenType.QUERY
+    })
+
     def __init__(self, tokens: t.List[Token]):
         self.tokens = tokens
         self.current = 0
@@ -54,8 +62,7 @@ class Parser:
         self._consume(TokenType.PROOF, "Expected PROOF after BEGIN")
 
         # Skip any EOL tokens
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         # Parse GIVEN statements
         given = []
@@ -63,15 +70,13 @@ class Parser:
             self._advance()  # Consume GIVEN
             given.append(self._consume(TokenType.IDENTIFIER, "Expected proposition identifier after GIVEN").lexeme)
             # Skip any EOL tokens
-            while self._check(TokenType.EOL):
-                self._advance()
+            self._skipeols()
 
         # Parse PROVE statement
         self._consume(TokenType.PROVE, "Expected PROVE in proof")
         prove = self._consume(TokenType.IDENTIFIER, "Expected proposition identifier").lexeme
         # Skip any EOL tokens
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         # Parse USING statement
         self._consume(TokenType.USING, "Expected USING after PROVE")
@@ -80,15 +85,14 @@ class Parser:
         while self._match(TokenType.COMMA):
             using.append(self._consume(TokenType.IDENTIFIER, "Expected identifier after comma").lexeme)
         # Skip any EOL tokens
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         # Parse proof steps
         steps = []
         while self._check(TokenType.STEP):
             # Parse step number
             self._advance()  # Consume STEP
-            step_num = int(float(self._consume(TokenType.NUMBER, "Expected step number").value))
+            step_num = self._stepnumber()
             self._consume(TokenType.COLON, "Expected colon after step number")
 
             # Parse step action (ASSERT or INFER)
@@ -100,10 +104,7 @@ class Parser:
             if self._match(TokenType.ASSERT):
                 action = "ASSERT"
                 # Collect tokens until EOL for the expression
-                exprtokens = []
-                while not self._check(TokenType.EOL) and not self._check(TokenType.EOF):
-                    exprtokens.append(self._advance().lexeme)
-                expr = " ".join(exprtokens)
+                expr = self._parsexpr()
             elif self._match(TokenType.INFER):
                 action = "INFER"
                 # Get proposition being inferred
@@ -125,19 +126,17 @@ class Parser:
                 raise ParseError(f"Expected ASSERT or INFER in step, got {self._peek().type}")
 
             # Add the step to our list
-            steps.append(ProofStep(step_num, f"{action} {expr}", source, via))
+            steps.append(ProofStep(step_num, action, expr, source, via))
 
             # Skip any EOL tokens
-            while self._check(TokenType.EOL):
-                self._advance()
+            self._skipeols()
 
         # Parse END PROOF
         self._consume(TokenType.END, "Expected END")
         self._consume(TokenType.PROOF, "Expected PROOF after END")
 
         # Skip any EOL tokens
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         return Proof(given, prove, using, steps)
 
@@ -256,8 +255,7 @@ class Parser:
         self._consume(TokenType.PROOF, "Expected PROOF after BEGIN")
 
         # Skip any EOL tokens
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         # Parse GIVEN
         given = []
@@ -266,16 +264,14 @@ class Parser:
             given.append(self._consume(TokenType.IDENTIFIER, "Expected proposition identifier after GIVEN").lexeme)
 
             # Optionally consume EOL
-            while self._check(TokenType.EOL):
-                self._advance()
+            self._skipeols()
 
         # Parse PROVE
         self._consume(TokenType.PROVE, "Expected PROVE in proof")
         prove = self._consume(TokenType.IDENTIFIER, "Expected proposition identifier").lexeme
 
         # Optionally consume EOL
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         # Parse USING
         self._consume(TokenType.USING, "Expected USING after PROVE")
@@ -285,8 +281,7 @@ class Parser:
             using.append(self._consume(TokenType.IDENTIFIER, "Expected identifier after comma").lexeme)
 
         # Optionally consume EOL
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         # Parse STEPS
         steps = []
@@ -295,16 +290,14 @@ class Parser:
             steps.append(step)
 
             # Optionally consume EOL
-            while self._check(TokenType.EOL):
-                self._advance()
+            self._skipeols()
 
         # Final END PROOF
         self._consume(TokenType.END, "Expected END")
         self._consume(TokenType.PROOF, "Expected PROOF after END")
 
         # Consume any remaining EOL
-        while self._check(TokenType.EOL):
-            self._advance()
+        self._skipeols()
 
         return Proof(given, prove, using, steps)
 
@@ -312,7 +305,7 @@ class Parser:
         """Parse a proof step."""
         self._consume(TokenType.STEP, "Expected STEP in proof")
 
-        number = int(float(self._consume(TokenType.NUMBER, "Expected step number").value))
+        number = self._stepnumber()
         self._consume(TokenType.COLON, "Expected colon after step number")
 
         source = None
@@ -341,7 +334,12 @@ class Parser:
             raise ParseError(f"Expected ASSERT or INFER in step, got {self._peek().type}")
 
         self._consume(TokenType.EOL, "Expected end of line after step")
-        return ProofStep(number, f"{action} {expr}", source, via)
+        return ProofStep(number, action, expr, source, via)
+
+    def _stepnumber(self) -> int:
+        """Consume a step number; integer literals are already lexed as int."""
+        value = self._consume(TokenType.NUMBER, "Expected step number").value
+        return value if type(value) is int else int(value)
 
     def _query(self) -> Query:
         """Parse a query statement."""
@@ -353,10 +351,13 @@ class Parser:
         """Parse an expression (simplified for now, returning raw text)."""
         # For a quick implementation, we'll just capture the tokens until EOL
         # and join them to create the expression string
-        exprtokens = []
-        while not self._check(TokenType.EOL) and not self._reachedend():
-            exprtokens.append(self._advance().lexeme)
-        return " ".join(exprtokens)
+        tokens = self.tokens
+        start = current = self.current
+        EOL, EOF = TokenType.EOL, TokenType.EOF
+        while (tokentype := tokens[current].type) is not EOL and tokentype is not EOF:
+            current += 1
+        self.current = current
+        return " ".join([token.lexeme for token in tokens[start:current]])
 
     # Helper methods
     def _reachedend(self) -> bool:
@@ -389,6 +390,15 @@ class Parser:
             return False
         return self.tokens[self.current + 1].type == type
 
+    def _skipeols(self) -> None:
+        """Fast-forward past any run of EOL tokens."""
+        tokens = self.tokens
+        current = self.current
+        EOL = TokenType.EOL
+        while tokens[current].type is EOL:
+            current += 1
+        self.current = current
+
     def _match(self, *types: TokenType) -> bool:
         for type in types:
             if self._check(type):
@@ -410,12 +420,7 @@ class Parser:
             if self._previous().type == TokenType.EOL:
                 return
 
-            if self._peek().type in [
-                TokenType.DEFINE,
-                TokenType.ASSERT,
-                TokenType.BEGIN,
-                TokenType.QUERY
-            ]:
+            if self._peek().type in self._SYNCTARGETS:
                 return
 
             self._advance()
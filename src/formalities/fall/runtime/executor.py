@@ -1,5 +1,5 @@
 # ~/formalities/src/formalities/fall/runtime/executor.py
-import typing as t
+import sys, typing as t
 from dataclasses import dataclass, field
 from loguru import logger as log
 from formalities.core.types.propositions import (
@@ -8,6 +8,7 @@ from formalities.core.types.propositions import (
 from formalities.core.types.operators import (
     ANDN, IMPLIES
 )
+from formalities.frameworks.base import VALIDRESULT
 from formalities.frameworks.simple import ClassicalFramework
 from formalities.validation.base import (
     ValidationResult, ValidationContext, Validator
@@ -17,11 +18,29 @@ from formalities.validation.strategies import (
 )
 from formalities.fall.bridges.logic import LogicBridge
 from formalities.fall.parser.abstract import (
-    Proof, ProofStep, AxiomDefinition
+    Proof, ProofStep, AxiomDefinition, UNKNOWNSTEP
 )
 
+# Operators carry no state beyond their arity, so inference compounds share instances
+IMPLIESOPERATOR = IMPLIES()
+ANDNOPERATORS: dict[int, ANDN] = {}
 
-@dataclass
+def andnoperator(arity: int) -> ANDN:
+    """Get the shared ANDN operator for an arity."""
+    if (operator := ANDNOPERATORS.get(arity)) is None:
+        operator = ANDNOPERATORS[arity] = ANDN(arity)
+    return operator
+
+def stepnumber(name: str) -> t.Optional[int]:
+    """The step number a 'step' prefixed name refers to, read as int() reads it ('step01', 'step 1'), if any."""
+    if not name.startswith("step"):
+        return None
+    try:
+        return int(name[4:])
+    except ValueError:
+        return None
+
+@dataclass(slots=True)
 class ProofContext:
     """Context for proof execution."""
     bridge: LogicBridge
@@ -29,18 +48,78 @@ class ProofContext:
     derived: dict[str, Proposition] = field(default_factory=dict)
     axioms: dict[str, AxiomDefinition] = field(default_factory=dict)
     steps: dict[int, Proposition] = field(default_factory=dict)
-    history: list[dict] = field(default_factory=list)
+    historysteps: list[int] = field(default_factory=list)
+    historyactions: list[str] = field(default_factory=list)
+    historyresults: list[bool] = field(default_factory=list)
+    historyerrors: list[t.Optional[str]] = field(default_factory=list)
     propsmetadata: dict[str, str] = field(default_factory=dict)
     semantictokens: set[str] = field(default_factory=set)
+    evalctx: dict[str, bool] = field(default_factory=dict)
+    namespace: dict[str, Proposition] = field(default_factory=dict)
+    symbolindex: dict[str, Proposition] = field(default_factory=dict)
+    compoundsteps: int = 0
+
+    def addgiven(self, name: str, prop: Proposition) -> None:
+        """Register a given proposition."""
+        self.givens[name] = prop
+        self.namespace[name] = prop
+        self._addtruthvalue(name, prop)
+
+    def addstep(self, number: int, prop: Proposition) -> None:
+        """Register a step result, reachable by its 'stepN' alias unless a given shadows it."""
+        self.steps[number] = prop
+        if hasattr(prop, 'symbol'):
+            self.symbolindex[prop.symbol] = prop
+        else:
+            self.compoundsteps += 1
+        alias = sys.intern(f"step{number}")
+        if alias not in self.givens:
+            self.namespace[alias] = prop
+
+    def addderived(self, name: str, prop: Proposition) -> None:
+        """Register a derived proposition, shadowed by givens and step aliases of the same name."""
+        self.derived[name] = prop
+        self._addtruthvalue(name, prop)
+        if name in self.givens:
+            return
+        if stepnumber(name) in self.steps:
+            return
+        self.namespace[name] = prop
+
+    def resolve(self, name: str) -> t.Optional[Proposition]:
+        """Look up a source name, falling back to steps for spellings other than the 'stepN' alias."""
+        if (prop := self.namespace.get(name)) is not None:
+            return prop
+        if (number := stepnumber(name)) is not None:
+            return self.steps.get(number)
+        return None
+
+    def _addtruthvalue(self, name: str, prop: Proposition) -> None:
+        """Evaluate a newly registered proposition once into the shared eval context."""
+        try:
+            self.evalctx[name] = prop.evaluate()
+            log.debug("Added to eval context: {} = {}", name, self.evalctx[name])
+        except ValueError:
+            log.debug("Could not evaluate: {}", name)
 
     def record(self, step: int, action: str, result: bool, error: t.Optional[str] = None) -> None:
         """Record a proof step outcome."""
-        self.history.append({
-            "step": step,
-            "action": action,
-            "result": result,
-            "error": error
-        })
+        self.historysteps.append(step)
+        self.historyactions.append(action)
+        self.historyresults.append(result)
+        self.historyerrors.append(error)
+
+    def entries(self) -> t.Iterator[tuple[int, str, bool, t.Optional[str]]]:
+        """Iterate recorded outcomes as (step, action, result, error) tuples."""
+        return zip(self.historysteps, self.historyactions, self.historyresults, self.historyerrors)
+
+    @property
+    def history(self) -> list[dict]:
+        """Recorded outcomes as a list of dicts."""
+        return [
+            {"step": step, "action": action, "result": result, "error": error}
+            for step, action, result, error in self.entries()
+        ]
 
 class ProofExecutor:
     """Executes FALL proofs by applying logical operations."""
@@ -55,6 +134,10 @@ class ProofExecutor:
         self.validator.addstrategy(LogicalConsistencyStrategy())
         self.nlpvalidationenabled = True
         self.debuglevel = 3
+        # axiom name -> (axiom, bridge generation parsed at, preconditions)
+        self._preconditions: dict[str, tuple[AxiomDefinition, int, t.List[Proposition]]] = {}
+        # Indexed by ProofStep.kind
+        self._stepexecutors = (self._executeassert, self._executeinfer)
 
     def executeproof(self, proof: Proof, axioms: dict[str, AxiomDefinition], propsmetadata: t.Optional[dict]=None) -> tuple[bool, ProofContext]:
         """Execute a proof and determine if it is valid."""
@@ -64,19 +147,19 @@ class ProofExecutor:
 
         if propsmetadata:
             context.propsmetadata = propsmetadata
-            log.debug(f"Loaded proposition metadata: {propsmetadata}")
+            log.debug("Loaded proposition metadata: {}", propsmetadata)
 
         # Register givens
-        for givenname in proof.given:
+        for givenname in map(sys.intern, proof.given):
             prop = self.bridge.getprop(givenname)
             if not prop:
                 log.error(f"Given proposition {givenname} not found")
                 context.record(0, f"SETUP:{givenname}", False, f"Proposition not found")
                 return False, context
-            context.givens[givenname] = prop
-            log.debug(f"Registered given proposition: {givenname} = {prop}")
+            context.addgiven(givenname, prop)
+            log.debug("Registered given proposition: {} = {}", givenname, prop)
 
-        # Execute each step
+        # Execute each step in order; the first failure ends the proof and history stays in step order
         for step in proof.steps:
             success = self._executestep(step, context)
             if not success:
@@ -84,72 +167,54 @@ class ProofExecutor:
                 return False, context
 
         # Check if we proved the target
+        target = proof.prove
+        conclusionstep, conclusionaction = len(proof.steps) + 1, f"CONCLUSION:{target}"
+
         # First check direct match by name in derived propositions
-        if proof.prove in context.derived:
-            log.info(f"Proof succeeded: {proof.prove} (found in derived propositions)")
-            context.record(len(proof.steps) + 1, f"CONCLUSION:{proof.prove}", True)
+        if target in context.derived:
+            log.info(f"Proof succeeded: {target} (found in derived propositions)")
+            context.record(conclusionstep, conclusionaction, True)
+            return True, context
+
+        # Then check if any step has a matching symbol
+        if target in context.symbolindex:
+            log.info(f"Proof succeeded: {target} (matched by symbol)")
+            context.record(conclusionstep, conclusionaction, True)
             return True, context
 
-        # Then check if any step has a matching symbol or represents the target
-        for stepnum, prop in context.steps.items():
-            # Handle both atomic and compound propositions
-            if hasattr(prop, 'symbol') and prop.symbol == proof.prove:
-                log.info(f"Proof succeeded: {proof.prove} (matched by symbol)")
-                context.record(len(proof.steps) + 1, f"CONCLUSION:{proof.prove}", True)
+        # For compound step results, check if the target was registered with a truth value
+        if context.compoundsteps:
+            registeredprop = self.bridge.getprop(target)
+            if registeredprop and registeredprop._truthvalue:
+                log.info(f"Proof succeeded: {target} (registered with truth value)")
+                context.record(conclusionstep, conclusionaction, True)
                 return True, context
 
-            # For compound propositions, check if they represent the target in any way
-            if not hasattr(prop, 'symbol'):
-                # This could be a compound proposition
-                # Let's see if this step's result was registered with the target name
-                registeredprop = self.bridge.getprop(proof.prove)
-                if registeredprop and registeredprop._truthvalue:
-                    log.info(f"Proof succeeded: {proof.prove} (registered with truth value)")
-                    context.record(len(proof.steps) + 1, f"CONCLUSION:{proof.prove}", True)
-                    return True, context
-
-        log.error(f"Proof failed: {proof.prove} not derived")
-        context.record(len(proof.steps) + 1, f"CONCLUSION:{proof.prove}", False, "Target not derived")
+        log.error(f"Proof failed: {target} not derived")
+        context.record(conclusionstep, conclusionaction, False, "Target not derived")
         return False, context
 
     def _executestep(self, step: ProofStep, context: ProofContext) -> bool:
         """Execute a single proof step."""
-        if step.action.startswith("ASSERT"):
-            return self._executeassert(step, context)
-        elif step.action.startswith("INFER"):
-            return self._executeinfer(step, context)
-        else:
+        if step.kind == UNKNOWNSTEP:
             log.error(f"Unknown action: {step.action}")
             context.record(step.number, "UNKNOWN", False, f"Unknown action: {step.action}")
             return False
+        return self._stepexecutors[step.kind](step, context)
 
     def _executeassert(self, step: ProofStep, context: ProofContext) -> bool:
         """Execute an assert step."""
-        expr = step.action.replace("ASSERT", "", 1).strip()
+        expr = step.expr
         try:
             prop = self.bridge.parseexpression(expr)
-            log.debug(f"Parsed assertion expression: {expr} -> {prop}")
+            log.debug("Parsed assertion expression: {} -> {}", expr, prop)
             # Validate this assertion given what we know
-            evalctx = {}
-            for name, p in context.givens.items():
-                try:
-                    evalctx[name] = p.evaluate()
-                    log.debug(f"Added given to eval context: {name} = {evalctx[name]}")
-                except ValueError:
-                    log.debug(f"Could not evaluate given: {name}")
-                    pass
-            for name, p in context.derived.items():
-                try:
-                    evalctx[name] = p.evaluate()
-                    log.debug(f"Added derived to eval context: {name} = {evalctx[name]}")
-                except ValueError:
-                    log.debug(f"Could not evaluate derived: {name}")
-                    pass
+            evalctx = context.evalctx
 
             # Register the step result
             stepname = f"step{step.number}"
-            context.steps[step.number] = prop
-            log.debug(f"Registered step {step.number} result: {prop}")
+            context.addstep(step.number, prop)
+            log.debug("Registered step {} result: {}", step.number, prop)
 
             # Record success
             context.record(step.number, f"ASSERT:{expr}", True)
@@ -163,56 +228,40 @@ class ProofExecutor:
         """
         Execute an inference step within a proof context, logging detailed operations.
         """
-        expr = step.action.replace("INFER", "", 1).strip()
+        expr = step.expr
         sources = step.source or []
         via = step.via
 
-        log.debug(f"Executing inference | Step: {step.number} | Expression: {expr} | Sources: {sources} | Via: {via}")
+        log.debug("Executing inference | Step: {} | Expression: {} | Sources: {} | Via: {}", step.number, expr, sources, via)
         sourceprops = []
 
+        # Givens, step aliases and derived names share one flat map, so each source is usually a single probe
         for sourcename in sources:
-            if sourcename in context.givens:
-                log.info(f"Source '{sourcename}' found in givens.")
-                sourceprops.append(context.givens[sourcename])
-                continue
-
-            try:
-                if sourcename.startswith("step"):
-                    stepnum = int(sourcename[4:])
-                    if stepnum in context.steps:
-                        log.info(f"Source '{sourcename}' found in previous steps.")
-                        sourceprops.append(context.steps[stepnum])
-                        continue
-            except ValueError:
-                log.warning(f"Invalid step reference: {sourcename}")
-
-            if sourcename in context.derived:
-                log.info(f"Source '{sourcename}' found in derived conclusions.")
-                sourceprops.append(context.derived[sourcename])
-                continue
-
-            log.error(f"Source not found: {sourcename}")
-            context.record(step.number, f"INFER:{expr}", False, f"Source not found: {sourcename}")
-            return False
+            if (prop := context.resolve(sourcename)) is None:
+                log.error(f"Source not found: {sourcename}")
+                context.record(step.number, f"INFER:{expr}", False, f"Source not found: {sourcename}")
+                return False
+            log.debug("Source '{}' found.", sourcename)
+            sourceprops.append(prop)
 
         if not (axiom := context.axioms.get(via)):
             log.error(f"Axiom not found: {via}")
             context.record(step.number, f"INFER:{expr}", False, f"Axiom not found: {via}")
             return False
 
-        log.info(f"Applying axiom '{via}' to inference.")
+        log.debug("Applying axiom '{}' to inference.", via)
 
         try:
-            premises = CompoundProposition(ANDN(len(sourceprops)), tuple(sourceprops))
             conclusion = AtomicProposition(expr, _truthvalue=True)
-
-            log.debug(f"Validating inference | Premises: {premises} | Conclusion: {conclusion}")
-            validationresult, _ = self.validator.validate(CompoundProposition(IMPLIES(), (premises, conclusion)))
+            if (validationresult := self._validateatomicpremises(sourceprops)) is None:
+                premises = CompoundProposition(andnoperator(len(sourceprops)), tuple(sourceprops))
+                log.debug("Validating inference | Premises: {} | Conclusion: {}", premises, conclusion)
+                validationresult, _ = self.validator.validate(CompoundProposition(IMPLIESOPERATOR, (premises, conclusion)))
 
             if validationresult.isvalid:
                 log.info(f"Inference valid | Step: {step.number} | Expression: {expr}")
-                context.steps[step.number] = conclusion
-                context.derived[expr] = conclusion
+                context.addstep(step.number, conclusion)
+                context.addderived(expr, conclusion)
 
                 if hasattr(self.bridge, 'registerprop'):
                     self.bridge.registerprop(expr, conclusion)
@@ -228,11 +277,47 @@ class ProofExecutor:
             context.record(step.number, f"INFER:{expr}", False, str(e))
             return False
 
+    def _validateatomicpremises(self, sourceprops: t.List[Proposition]) -> t.Optional[ValidationResult]:
+        """
+        Decide an inference directly from premise truth values when every premise is a plain atomic proposition.
+
+        With the default classical validator, `(p1 ∧ ... ∧ pn) → conclusion` over atomic premises contains no
+        conjunction to contradict, and the conclusion is fixed true, so the only possible failure is a premise
+        without a truth value. Returns None when the full validator is needed.
+        """
+        if (len(sourceprops) < 2) or (not self._defaultvalidation):
+            return None
+        for prop in sourceprops:
+            if type(prop) is not AtomicProposition:
+                return None
+        for prop in sourceprops:
+            if prop._truthvalue is None:
+                return ValidationResult(False, [f"Evaluation Error: No Truth Value for {prop.symbol}"])
+        return VALIDRESULT
+
+    @property
+    def _defaultvalidation(self) -> bool:
+        """Whether the validator still has the configuration the atomic fast path assumes."""
+        return (
+            type(self.validator.framework) is ClassicalFramework and
+            [type(s) for s in self.validator._strategies] == [SyntacticValidationStrategy, LogicalConsistencyStrategy]
+        )
+
     def getaxiompreconditions(self, axiom: AxiomDefinition) -> t.List[Proposition]:
+        """Get the preconditions of an axiom, compiling them on first use and again once the bridge's propositions change."""
+        generation = self.bridge.generation
+        cached = self._preconditions.get(axiom.name)
+        if cached is not None and cached[0] is axiom and cached[1] == generation:
+            return cached[2]
+        result = self.compileaxiom(axiom)
+        self._preconditions[axiom.name] = (axiom, generation, result)
+        return result
+
+    def compileaxiom(self, axiom: AxiomDefinition) -> t.List[Proposition]:
         """
         Extract preconditions from an axiom as propositions, logging processed axiom and extracted conditions.
         """
-        log.debug(f"Processing axiom: {axiom.name}")
+        log.debug("Processing axiom: {}", axiom.name)
         result = []
 
         for condition in axiom.conditions:
@@ -243,7 +328,7 @@ class ProofExecutor:
             except Exception as e:
                 log.error(f"Failed to parse axiom condition '{condition.expression}' in '{axiom.name}': {str(e)}")
 
-        log.debug(f"Completed axiom processing: {axiom.name} | Extracted Preconditions: {result}")
+        log.debug("Completed axiom processing: {} | Extracted Preconditions: {}", axiom.name, result)
         return result
 
 
@@ -251,7 +336,7 @@ class ProofExecutor:
 '''
 def _executeinfer(self, step, context):
     """Execute an infer step with semantic validation."""
-    expr = step.action.replace("INFER", "", 1).strip()
+    expr = step.expr
     log.debug(f"Executing inference step {step.number}: {expr}")
 
     # Validate that all sources and axiom exist
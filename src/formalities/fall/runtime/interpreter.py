@@ -1,13 +1,18 @@
 # ~/formalities/src/formalities/fall/runtime/interpreter.py
-import typing as t
+import sys, dataclasses, typing as t
 from formalities.fall.parser.abstract import (
     Node, Program, RuleDefinition, AxiomDefinition,
     PropositionDefinition, Assertion, Proof, ProofStep, Query, Condition, Visitor
 )
 from formalities.fall.bridges.logic import LogicBridge
+from formalities.fall.utils.exceptions import ValidationException
 from formalities.fall.runtime.validator import FallValidator
 from formalities.fall.runtime.executor import ProofExecutor
 from loguru import logger as log
+try:
+    from formalities.fall.bridges.nlp import NLPBridge
+except ImportError:
+    NLPBridge = None
 
 class Environment:
     """Environment for storing variables and definitions during execution."""
@@ -26,6 +31,7 @@ class Environment:
         self.propositions = {}
         self.assertions = []
         self.proofs = []
+        self.proven = {}
         self.output = []
 
     def definerule(self, name: str, rule: RuleDefinition) -> None:
@@ -39,6 +45,7 @@ class Environment:
 
     def defineaxiom(self, name: str, axiom: AxiomDefinition) -> None:
         """Define an axiom with validation."""
+        name = sys.intern(name)
         validation = self.validator.validateaxiom(axiom)
         if validation.isvalid:
             self.axioms[name] = axiom
@@ -90,15 +97,16 @@ class Environment:
             if success:
                 self.output.append(f"Proof succeeded! Established: {proof.prove}")
                 self.proofs.append(proof)
+                self.proven[proof.prove] = proof
             else:
                 self.output.append(f"Proof failed. Check the steps and logic.")
 
             # Output step history
-            for entry in context.history:
-                if entry.get("error"):
-                    self.output.append(f"Step {entry['step']}: {entry['action']} - FAILED: {entry['error']}")
+            for step, action, _, error in context.entries():
+                if error:
+                    self.output.append(f"Step {step}: {action} - FAILED: {error}")
                 else:
-                    self.output.append(f"Step {entry['step']}: {entry['action']} - SUCCESS")
+                    self.output.append(f"Step {step}: {action} - SUCCESS")
         else:
             self.output.append(f"Invalid proof: {'; '.join(validation.errors)}")
 
@@ -122,33 +130,32 @@ class Environment:
                     # If we get here, the proposition exists but has no direct truth value
 
                     # Check if it has been established in any proof
-                    for proof in self.proofs:
-                        if proof.prove == propname:
-                            self.output.append(f"Proposition {propname} was established by proof")
-                            # Since it was proven, we can set its truth value and re-attempt evaluation
-                            if hasattr(logicalprop, '_truthvalue'):
-                                # Use direct attribute access to bypass frozen dataclass restrictions
-                                object.__setattr__(logicalprop, '_truthvalue', True)                 # Use direct attribute access to bypass frozen dataclass restrictions
-                                try:
-                                    result = logicalprop.evaluate()
-                                    self.output.append(f"Evaluation after proof: {result}")
-                                    return result
-                                except Exception:
-                                    # If evaluation still fails, just return True since it was proven
-                                    return True
-                            return True
+                    if propname in self.proven:
+                        self.output.append(f"Proposition {propname} was established by proof")
+                        # Since it was proven, register a copy holding its truth value and re-attempt evaluation,
+                        # leaving the original untouched for anything else holding it
+                        if hasattr(logicalprop, '_truthvalue'):
+                            try:
+                                logicalprop = dataclasses.replace(logicalprop, _truthvalue=True)
+                                self.bridge.registerprop(propname, logicalprop)
+                                result = logicalprop.evaluate()
+                                self.output.append(f"Evaluation after proof: {result}")
+                                return result
+                            except Exception:
+                                # If evaluation still fails, just return True since it was proven
+                                return True
+                        return True
 
                     # Check if we have a derived proposition with this name
-                    for name, prop in self.bridge._propositions.items():
-                        if name == propname:
-                            # Try to evaluate, but handle the case where it might not have a truth value
-                            try:
-                                value = prop.evaluate()
-                                self.output.append(f"Proposition {propname} was derived with value: {value}")
-                                return value
-                            except ValueError:
-                                # No truth value available
-                                pass
+                    if (prop := self.bridge._propositions.get(propname)) is not None:
+                        # Try to evaluate, but handle the case where it might not have a truth value
+                        try:
+                            value = prop.evaluate()
+                            self.output.append(f"Proposition {propname} was derived with value: {value}")
+                            return value
+                        except ValueError:
+                            # No truth value available
+                            pass
 
                     self.output.append(f"Cannot evaluate: {str(e)}")
                 except Exception as e:
@@ -157,10 +164,9 @@ class Environment:
             return None
 
         # Check if it can be derived from proofs
-        for proof in self.proofs:
-            if proof.prove == propname:
-                self.output.append(f"Proposition {propname} is proven")
-                return True
+        if propname in self.proven:
+            self.output.append(f"Proposition {propname} is proven")
+            return True
 
         self.output.append(f"Unknown proposition: {propname}")
         return False
@@ -176,14 +182,16 @@ class Interpreter(Visitor):
 
     def __init__(self):
         self.environment = Environment()
+        # Shared across proposition definitions so the spaCy model loads at most once
+        self.nlp = NLPBridge() if NLPBridge is not None else None
 
     def interpret(self, program: Program) -> None:
         """Interpret a FALL program."""
-        program.accept(self)
+        self.dispatch(program)
 
     def _execute(self, node: Node) -> None:
         """Execute a node by visiting it."""
-        node.accept(self)
+        self.dispatch(node)
 
     def visitruledef(self, node: RuleDefinition) -> None:
         """Visit a rule definition."""
@@ -198,10 +206,8 @@ class Interpreter(Visitor):
         #log.debug(f"Defining Proposition: {node.name}")
         # Try to use NLP bridge to enhance the proposition's structure
         try:
-            from formalities.fall.bridges.nlp import NLPBridge
-            nlp = NLPBridge()
-            if 'structure' not in node.structure:
-                extracted = nlp.extractstructure(node.text)
+            if (self.nlp is not None) and ('structure' not in node.structure):
+                extracted = self.nlp.extractstructure(node.text)
                 structdict = {
                     'subject': extracted.subject,
                     'verb': extracted.verb,
@@ -211,6 +217,10 @@ class Interpreter(Visitor):
                 # Add NLP-extracted structure to the proposition's structure
                 node.structure['nlpstructure'] = str(structdict)
                 #log.debug(f"Enhanced proposition with NLP structure: {structdict}")
+        except ValidationException as e:
+            # The model could not be loaded; it will not appear later in the run
+            #log.error(f"NLP enhancement failed: {str(e)}")
+            self.nlp = None
         except Exception as e:
             #log.error(f"NLP enhancement failed: {str(e)}")
             pass
@@ -223,8 +233,6 @@ class Interpreter(Visitor):
     def visitproof(self, node: Proof) -> None:
         """Visit a proof."""
         self.environment.executeproof(node)
-        for step in node.steps:
-            step.accept(self)
 
     def visitproofstep(self, node: ProofStep) -> None:
         """Visit a proof step."""
@@ -242,7 +250,7 @@ class Interpreter(Visitor):
         #log.debug(f"Visiting Program with {len(node.statements)} Statements")
         for statement in node.statements:
             #log.debug(f"Executing Statement of type: {type(statement).__name__}")
-            statement.accept(self)
+            self.dispatch(statement)
 
     def visitcondition(self, node: Condition) -> None:
         """Visit a condition."""
@@ -1,11 +1,13 @@
 # ~/formalities/src/formalities/fall/runtime/shell.py
-import os, cmd, sys, traceback, readline, re
+import os, cmd, sys, traceback, readline, re, functools, importlib.util
 from loguru import logger as log
 PYGMENTSAVAILABLE = False
+PYGMENTSIMPORTED = False
 
 def importpygments():
-    global PYGMENTSAVAILABLE
-    global pygments, highlight, FALLLexer, formatter
+    global PYGMENTSAVAILABLE, PYGMENTSIMPORTED
+    PYGMENTSIMPORTED = True
+    global pygments, highlight, FALLLexer, FALLLEXER, formatter
     try:
         import pygments
         from pygments import highlight
@@ -51,6 +53,9 @@ def importpygments():
                 ]
             }
 
+        # RegexLexer compiles its token table on first instantiation; share one instance
+        FALLLEXER = FALLLexer()
+
         # Try to get 256 color support, fallback to 16 colors if needed
         try:
             # Use Terminal256Formatter with explicit style and force colorization
@@ -70,62 +75,121 @@ def importpygments():
         print("Syntax Highlighting Disabled.")
         return False
 
-importpygments()
+def usepygments() -> bool:
+    """Import pygments on first use, so shell startup and script runs don't pay for it."""
+    if not PYGMENTSIMPORTED:
+        importpygments()
+    return PYGMENTSAVAILABLE
+
 from formalities.fall.parser.lexing import Lexer
 from formalities.fall.parser.parsing import Parser
 from formalities.fall.runtime.interpreter import Interpreter
 
+# Leading keyword of a shell input line, classified in one match
+LINEKINDPATTERN = re.compile(r'\s*(BEGIN|END|DEFINE|ASSERT)')
+# Line kinds that keep collecting input when they arrive without a terminator
+CONTINUEDKINDS = frozenset({'DEFINE', 'ASSERT'})
+# Proof clauses that need explicit terminators when a proof block is joined onto one line
+PROOFCLAUSEPATTERN = re.compile(r'BEGIN PROOF|END PROOF|GIVEN|PROVE|USING|STEP')
+PROOFCLAUSES = {
+    'BEGIN PROOF': 'BEGIN PROOF //',
+    'END PROOF': '// END PROOF',
+    'GIVEN': '// GIVEN',
+    'PROVE': '// PROVE',
+    'USING': '// USING',
+    'STEP': '// STEP',
+}
+
+@functools.lru_cache(maxsize=256)
 def syntaxhighlight(code):
     """Apply syntax highlighting to FALL code."""
-    if not PYGMENTSAVAILABLE:
+    if not usepygments():
         return code
     try:
-        # Use our global formatter
-        return highlight(code, FALLLexer(), formatter)
+        # Use our global lexer and formatter
+        return highlight(code, FALLLEXER, formatter)
     except Exception as e:
         #log.error(f"Syntax highlighting failed: {str(e)}")
         return code
 
+# Lexing and parsing depend only on the source text; interpretation always reruns
+@functools.lru_cache(maxsize=128)
+def lexsource(source):
+    """Scan FALL source into tokens, reusing the result for repeated input."""
+    return Lexer(source).scantokens()
+
+@functools.lru_cache(maxsize=128)
+def parsesource(source):
+    """Parse FALL source into a program, reusing the result for repeated input."""
+    return Parser(lexsource(source)).parse()
+
+@functools.cache
+def renderexamples(examples):
+    """Highlight the code lines of an examples tuple once per process."""
+    return tuple(
+        syntaxhighlight(example) if (example.strip() and not example.startswith('#') and usepygments()) else example
+        for example in examples
+    )
+
 class FallShell(cmd.Cmd):
     intro = "FALL 0.1.0 (Formal Agnostic-Logic Language)"  # Empty intro to avoid showing it at startup
     prompt = 'FALL >>> '
     histfile = os.path.expanduser("~/.fallhistory")
     histfilesize = 1000
     debugmode = False
+    examples = (
+        "# Define a simple rule",
+        "DEFINE RULE SubjectPredicate WHERE SUBJECT CAN BE NOUN AND PREDICATE CAN BE VERB //",
+        "",
+        "# Define a proposition",
+        "DEFINE PROPOSITION p AS \"The sky is blue\" WHERE \"sky\" IS SUBJECT AND \"blue\" IS PREDICATE //",
+        "",
+        "# Define an axiom",
+        "DEFINE AXIOM ModusPonens WHERE p IMPLIES q AND p IS true //",
+        "",
+        "# Make an assertion",
+        "ASSERT p //",
+        "ASSERT p AND q //",
+        "ASSERT p IMPLIES q //",
+        "",
+        "# Create a simple proof",
+        "BEGIN PROOF",
+        "GIVEN p",
+        "PROVE q",
+        "USING ModusPonens",
+        "STEP 1: ASSERT p IMPLIES q",
+        "STEP 2: INFER q FROM [p] VIA ModusPonens",
+        "END PROOF //",
+        "",
+        "# Make a query",
+        "QUERY p //",
+    )
 
     def __init__(self):
         super().__init__()
         self.interpreter = Interpreter()
         # Keep track of multiline input
-        self.buffer = []
+        self.clearbuffer()
 
         # Initialize readline history - handle permissions errors gracefully
         if readline:
+            # Cap the history whichever file ends up being used, postloop relies on it
+            readline.set_history_length(self.histfilesize)
             try:
-                if os.path.exists(self.histfile):
+                # Skip the read entirely for a missing or empty history file
+                if os.path.exists(self.histfile) and os.path.getsize(self.histfile):
                     readline.read_history_file(self.histfile)
-                readline.set_history_length(self.histfilesize)
             except (IOError, OSError, PermissionError) as e:
                 # Create a temporary history file in the current directory if we can't access the home one
                 self.histfile = "./.fallhistory"
                 #log.warning(f"Could not access history file in home directory: {str(e)}")
                 #log.info(f"Using local history file: {self.histfile}")
 
-    def preloop(self):
-        """Hook method executed once when the cmdloop() method is called."""
-        if readline:
-            try:
-                if os.path.exists(self.histfile):
-                    readline.read_history_file(self.histfile)
-            except (IOError, OSError, PermissionError):
-                # Already handled in __init__
-                pass
-
     def postloop(self):
         """Hook method executed once when the cmdloop() method is about to return."""
         if readline:
             try:
-                readline.set_history_length(self.histfilesize)
+                # History length is capped in __init__, before any history file is touched
                 readline.write_history_file(self.histfile)
                 print(f"Command history saved to {self.histfile}")
             except (IOError, OSError, PermissionError) as e:
@@ -133,31 +197,21 @@ class FallShell(cmd.Cmd):
 
     def default(self, line):
         """Handle any unrecognized command by treating it as FALL code."""
-        # Add to readline history for multi-line input
-        if line.strip() and readline:
-            try:
-                readline.add_history(line)
-            except Exception:
-                pass  # Ignore readline errors
-
         # Check if we've started a multi-line construct (like BEGIN PROOF)
-        inmultiline = len(self.buffer) > 0 and any(l.strip().startswith("BEGIN") for l in self.buffer)
-        startingmultiline = line.strip().startswith("BEGIN")
-        endingmultiline = line.strip().startswith("END")
+        inmultiline = self.hasbegin
+        kind = match.group(1) if (match := LINEKINDPATTERN.match(line)) else None
+        startingmultiline = kind == "BEGIN"
 
         # Add the current line to the buffer
-        self.buffer.append(line)
+        stripped = self.bufferline(line, kind)
 
         # Process if this is a complete statement
-        if line.strip().endswith('//'):
+        if stripped.endswith('//'):
             # Complete statement with terminator
             self._processbuffer()
-        elif endingmultiline and line.strip().endswith('//'):
-            # END of a multi-line construct with terminator
-            self._processbuffer()
         elif not inmultiline and not startingmultiline:
             # Process immediately for simple statements without terminator (but not in multi-line mode)
-            if not line.strip().startswith('DEFINE') and not line.strip().startswith('ASSERT'):
+            if kind not in CONTINUEDKINDS:
                 self._processbuffer()
             else:
                 # Continue collecting for certain statements that might be multi-line
@@ -166,14 +220,46 @@ class FallShell(cmd.Cmd):
             # Continue collecting input
             self.prompt = '.... >>> '
 
+    def bufferline(self, line, kind=None):
+        """Append a line to the input buffer, updating the block flags from that line alone. Returns the stripped line."""
+        self.buffer.append(line)
+        self.strippedbuffer.append(stripped := line.strip())
+        if kind == "BEGIN":
+            self.hasbegin = True
+        if 'BEGIN PROOF' in line:
+            self.hasbeginproof = True
+        if 'END PROOF' in line:
+            self.hasendproof = True
+        return stripped
+
+    def clearbuffer(self):
+        """Empty the input buffer and its block flags."""
+        self.buffer = []
+        self.strippedbuffer = []
+        self.hasbegin = False
+        self.hasbeginproof = False
+        self.hasendproof = False
+
+    def _collapsehistory(self, source):
+        """Replace the history entries readline made for the buffered lines with the joined statement."""
+        # input() already adds every non-empty line it reads; only collapse entries that match the buffer
+        lines = [line for line in self.strippedbuffer if line]
+        start = readline.get_current_history_length() - len(lines)
+        if lines and start >= 0 and all(
+            (readline.get_history_item(start + i + 1) or '').strip() == line for i, line in enumerate(lines)
+        ):
+            for _ in lines:
+                readline.remove_history_item(start)
+        readline.add_history(source)
+
     def _processbuffer(self):
         """Process the accumulated input buffer."""
         if not self.buffer:
             return
 
         # Special handling for proof blocks
-        hasbeginproof = any('BEGIN PROOF' in line for line in self.buffer)
-        hasendproof = any('END PROOF' in line for line in self.buffer)
+        hasbeginproof = self.hasbeginproof
+        hasendproof = self.hasendproof
 
         # For incomplete proof blocks, keep collecting
         if hasbeginproof and not hasendproof:
@@ -181,45 +267,39 @@ class FallShell(cmd.Cmd):
             return
 
         # Process the buffer into a single source
-        source = ' '.join(line.strip() for line in self.buffer)
+        source = ' '.join(self.strippedbuffer)
 
         # Replace certain newline sequences for better parsing
         if hasbeginproof:
             # Make sure each part of the proof is properly separated
-            source = source.replace('BEGIN PROOF', 'BEGIN PROOF //').replace('GIVEN', '// GIVEN')
-            source = source.replace('PROVE', '// PROVE').replace('USING', '// USING')
-            source = source.replace('STEP', '// STEP')
-            source = source.replace('END PROOF', '// END PROOF')
+            source = PROOFCLAUSEPATTERN.sub(lambda m: PROOFCLAUSES[m.group()], source)
 
         # Ensure // terminator
-        if not source.strip().endswith('//'):
+        # Buffered lines are already stripped; only a trailing empty line can leave whitespace
+        if not source.rstrip().endswith('//'):
             source += ' //'
 
         # Clear buffer and reset prompt
-        self.buffer = []
-        self.prompt = 'FALL >>> '
-
-        # Add to history
-        if source.strip() and readline:
+        # Add to history (source always carries a terminator by now)
+        if readline:
             try:
-                readline.add_history(source)
+                self._collapsehistory(source)
             except Exception:
                 pass  # Ignore readline errors
 
+        self.clearbuffer()
+        self.prompt = 'FALL >>> '
+
         # Debug the processed input with syntax highlighting
         if self.debugmode:
             print("\n--- Processing: ---")
             highlighted = syntaxhighlight(source)
             print(highlighted)
 
+        tokens = []
         try:
             # Lex phase
-            lexer = Lexer(source)
-            tokens = lexer.scantokens()
-
-            # Extract for debugging
-            token_types = [t.type.name for t in tokens]
-            token_texts = [t.lexeme for t in tokens]
+            tokens = lexsource(source)
 
             if self.debugmode:
                 print("\n--- Lexer Output ---")
@@ -227,8 +307,7 @@ class FallShell(cmd.Cmd):
                     print(f"{i}: {token.type.name:<15}: {token.lexeme}")
 
             # Parse phase
-            parser = Parser(tokens)
-            program = parser.parse()
+            program = parsesource(source)
 
             if self.debugmode:
                 print("\n--- Parser Output ---")
@@ -253,14 +332,15 @@ class FallShell(cmd.Cmd):
                 traceback.print_exc()
             else:
                 print("(Run with 'debug on' for more detailed error information)")
-                print(f"Token types: {token_types}")
-                print(f"Token texts: {token_texts}")
+                # Only the error report needs these, so build them here
+                print(f"Token types: {[t.type.name for t in tokens]}")
+                print(f"Token texts: {[t.lexeme for t in tokens]}")
 
     def emptyline(self):
         """Handle empty lines."""
         if self.buffer:
             # If we have pending input, treat empty line as continuation
-            self.buffer.append('')
+            self.bufferline('')
         else:
             # Otherwise, do nothing
             pass
@@ -298,7 +378,9 @@ class FallShell(cmd.Cmd):
     def do_reset(self, arg):
         """Reset the interpreter environment."""
         self.interpreter = Interpreter()
-        self.buffer = []
+        self.clearbuffer()
+        lexsource.cache_clear()
+        parsesource.cache_clear()
         print("Environment reset.")
 
     def do_debug(self, arg):
@@ -323,7 +405,7 @@ class FallShell(cmd.Cmd):
 
     def do_pygments(self, arg):
         """Check Pygments status."""
-        if PYGMENTSAVAILABLE:
+        if usepygments():
             print("Pygments is available. Syntax highlighting is enabled.")
             print(f"Pygments version: {pygments.__version__}")
         else:
@@ -332,42 +414,12 @@ class FallShell(cmd.Cmd):
 
     def do_examples(self, arg):
         """Show example FALL commands."""
-        examples = [
-            "# Define a simple rule",
-            "DEFINE RULE SubjectPredicate WHERE SUBJECT CAN BE NOUN AND PREDICATE CAN BE VERB //",
-            "",
-            "# Define a proposition",
-            "DEFINE PROPOSITION p AS \"The sky is blue\" WHERE \"sky\" IS SUBJECT AND \"blue\" IS PREDICATE //",
-            "",
-            "# Define an axiom",
-            "DEFINE AXIOM ModusPonens WHERE p IMPLIES q AND p IS true //",
-            "",
-            "# Make an assertion",
-            "ASSERT p //",
-            "ASSERT p AND q //",
-            "ASSERT p IMPLIES q //",
-            "",
-            "# Create a simple proof",
-            "BEGIN PROOF",
-            "GIVEN p",
-            "PROVE q",
-            "USING ModusPonens",
-            "STEP 1: ASSERT p IMPLIES q",
-            "STEP 2: INFER q FROM [p] VIA ModusPonens",
-            "END PROOF //",
-            "",
-            "# Make a query",
-            "QUERY p //",
-        ]
         print("\nFALL Examples:")
         print("-------------")
 
         # Print examples with syntax highlighting if available
-        for example in examples:
-            if example.strip() and not example.startswith('#') and PYGMENTSAVAILABLE:
-                print(syntaxhighlight(example))
-            else:
-                print(example)
+        for example in renderexamples(self.examples):
+            print(example)
 
         print("\nTo use an example, copy and paste it into the shell.")
 
@@ -477,8 +529,8 @@ def main():
     parser.add_argument('-d', '--debug', action='store_true', help='Enable debug mode')
     args = parser.parse_args()
 
-    # Check Pygments at startup
-    if PYGMENTSAVAILABLE:
+    # Check Pygments at startup without importing it
+    if importlib.util.find_spec('pygments') is not None:
         #print(f"Syntax highlighting enabled (Pygments v{pygments.__version__})")
         pass
     else:
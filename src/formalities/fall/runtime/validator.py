@@ -1,11 +1,12 @@
 # ~/formalities/src/formalities/fall/runtime/validator.py
-import typing as t
+import time, typing as t
+from collections import deque
 from dataclasses import dataclass, field
 from loguru import logger as log
 from formalities.fall.bridges.logic import LogicBridge
 from formalities.fall.parser.abstract import (
     PropositionDefinition, Assertion, RuleDefinition,
-    AxiomDefinition, Proof, ProofStep
+    AxiomDefinition, Proof, ProofStep, ASSERTSTEP, INFERSTEP
 )
 from formalities.core.types.propositions import Proposition
 from formalities.validation.base import ValidationResult
@@ -14,6 +15,9 @@ class ValidationError(Exception):
     """Exception raised when validation fails."""
     pass
 
+# Records kept by a FALL validation context; older records are dropped first
+HISTORYLIMIT = 10000
+
 @dataclass
 class ValidationContext:
     """Context for validation operations within FALL."""
@@ -22,16 +26,19 @@ class ValidationContext:
     axioms: dict[str, AxiomDefinition] = field(default_factory=dict)
     options: dict[str, t.Any] = field(default_factory=dict)
     metadata: dict[str, t.Any] = field(default_factory=dict)
-    history: list[dict[str, t.Any]] = field(default_factory=list)
+    records: deque[tuple[str, bool, tuple[str, ...], int]] = field(default_factory=lambda: deque(maxlen=HISTORYLIMIT))
 
     def record(self, source: str, success: bool, errors: t.Optional[list[str]] = None) -> None:
-        """Record a validation result"""
-        self.history.append({
-            "source": source,
-            "success": success,
-            "errors": errors or [],
-            "timestamp": "current_time()"  # TODO: Add proper timestamp
-        })
+        """Record a validation result as (source, success, errors, monotonic timestamp in ns)"""
+        self.records.append((source, success, tuple(errors) if errors else (), time.monotonic_ns()))
+
+    @property
+    def history(self) -> list[dict[str, t.Any]]:
+        """Recorded validation results as a list of dicts."""
+        return [
+            {"source": source, "success": success, "errors": list(errors), "timestamp": timestamp}
+            for source, success, errors, timestamp in self.records
+        ]
 
 class FallValidator:
     """Validator for FALL language constructs."""
@@ -40,6 +47,10 @@ class FallValidator:
         """Initialize the validator with an optional logic bridge."""
         self.bridge = bridge or LogicBridge()
         self.context = ValidationContext(self.bridge)
+        # Logic errors from earlier bridge validations, keyed by what they depend on
+        self._propositionerrors: dict[tuple, tuple[str, ...]] = {}
+        self._conditionerrors: dict[tuple, tuple[str, ...]] = {}
+        self._conditiongeneration = self.bridge.generation
 
     def validateproposition(self, propdef: PropositionDefinition) -> ValidationResult:
         """
@@ -48,7 +59,7 @@ class FallValidator:
         log.debug(f"Validating proposition: {propdef.name}")
         errors = []
 
-        if not propdef.name or not propdef.name.isalnum():
+        if not propdef.name or not propdef.name.isidentifier():
             errors.append(f"Invalid proposition name: {propdef.name}")
         if not propdef.text:
             errors.append("Proposition text cannot be empty")
@@ -58,9 +69,12 @@ class FallValidator:
 
         try:
             logprop = self.bridge.createproposition(propdef.name)
-            propvalidation = self.bridge.validateproposition(logprop)
-            if not propvalidation.isvalid:
-                errors.extend(propvalidation.errors)
+            # A freshly created atomic proposition validates the same way every time for a given framework
+            key = (propdef.name, self.bridge.framework)
+            if (logicerrors := self._propositionerrors.get(key)) is None:
+                propvalidation = self.bridge.validateproposition(logprop)
+                logicerrors = self._propositionerrors[key] = () if propvalidation.isvalid else tuple(propvalidation.errors)
+            errors.extend(logicerrors)
         except Exception as e:
             log.error(f"Logic validation error for proposition '{propdef.name}': {str(e)}")
             errors.append(f"Logic error: {str(e)}")
@@ -105,38 +119,31 @@ class FallValidator:
         """Validate a proof."""
         errors = []
 
-        # Check that all given propositions exist
-        for propname in proof.given:
-            if not self.bridge.getprop(propname):
-                errors.append(f"Unknown given proposition: {propname}")
-
-        # Check that the proposition to prove exists
-        if not self.bridge.getprop(proof.prove):
+        # Check that all given propositions and the proposition to prove exist, in one bridge lookup
+        known = self.bridge.getprops((*proof.given, proof.prove))
+        errors.extend(f"Unknown given proposition: {propname}" for propname in proof.given if propname not in known)
+        if proof.prove not in known:
             errors.append(f"Unknown proposition to prove: {proof.prove}")
 
         # Check that all axioms used exist
-        for axiomname in proof.using:
-            if axiomname not in self.context.axioms:
-                errors.append(f"Unknown axiom: {axiomname}")
+        axioms = self.context.axioms
+        errors.extend(f"Unknown axiom: {axiomname}" for axiomname in proof.using if axiomname not in axioms)
 
         # Check each proof step
-        stepprops = {}  # Track propositions established in each step
         for step in proof.steps:
             # Simple validation for now, more complex validation in executor
-            if step.action.startswith("ASSERT"):
+            if step.kind == ASSERTSTEP:
                 try:
-                    expr = step.action.replace("ASSERT", "", 1).strip()
-                    logprop = self.bridge.parseexpression(expr)
-                    stepprops[f"step{step.number}"] = logprop
+                    self.bridge.parseexpression(step.expr)
                 except Exception as e:
                     errors.append(f"Step {step.number} error: {str(e)}")
-            elif step.action.startswith("INFER"):
+            elif step.kind == INFERSTEP:
                 # For inference steps, check sources and axiom
                 if not step.source:
                     errors.append(f"Step {step.number} has no source")
                 if not step.via:
                     errors.append(f"Step {step.number} has no axiom")
-                if step.via and step.via not in self.context.axioms:
+                if step.via and step.via not in axioms:
                     errors.append(f"Step {step.number} uses unknown axiom: {step.via}")
 
         result = ValidationResult(len(errors) == 0, errors)
@@ -152,22 +159,30 @@ class FallValidator:
         errors = []
 
         # Check that the axiom name is valid
-        if not axiom.name or not axiom.name.isalnum():
+        if not axiom.name or not axiom.name.isidentifier():
             errors.append(f"Invalid axiom name: {axiom.name}")
 
         # Check that there is at least one condition
         if not axiom.conditions:
             errors.append("Axiom must have at least one condition")
 
-        # Validate each condition expression
-        for condition in axiom.conditions:
-            try:
-                logprop = self.bridge.parseexpression(condition.expression)
-                propvalidation = self.bridge.validateproposition(logprop)
-                if not propvalidation.isvalid:
-                    errors.extend(propvalidation.errors)
-            except Exception as e:
-                errors.append(f"Condition error: {str(e)}")
+        # Validate each condition expression, reusing the outcome while the bridge is unchanged
+        self._syncconditionerrors()
+        key = (tuple(condition.expression for condition in axiom.conditions), self.bridge.framework)
+        if (conditionerrors := self._conditionerrors.get(key)) is None:
+            conditionerrors = []
+            for condition in axiom.conditions:
+                try:
+                    logprop = self.bridge.parseexpression(condition.expression)
+                    propvalidation = self.bridge.validateproposition(logprop)
+                    if not propvalidation.isvalid:
+                        conditionerrors.extend(propvalidation.errors)
+                except Exception as e:
+                    conditionerrors.append(f"Condition error: {str(e)}")
+            # Parsing may create propositions, so resync before storing
+            self._syncconditionerrors()
+            conditionerrors = self._conditionerrors[key] = tuple(conditionerrors)
+        errors.extend(conditionerrors)
 
         result = ValidationResult(len(errors) == 0, errors)
         self.context.record(
@@ -177,12 +192,18 @@ class FallValidator:
         )
         return result
 
+    def _syncconditionerrors(self) -> None:
+        """Drop cached axiom condition errors once the bridge's propositions have changed."""
+        if self._conditiongeneration != self.bridge.generation:
+            self._conditionerrors.clear()
+            self._conditiongeneration = self.bridge.generation
+
     def validaterule(self, rule: RuleDefinition) -> ValidationResult:
         """Validate a rule definition."""
         errors = []
 
         # Check that the rule name is valid
-        if not rule.name or not rule.name.isalnum():
+        if not rule.name or not rule.name.isidentifier():
             errors.append(f"Invalid rule name: {rule.name}")
 
         # Check that there is at least one condition
@@ -1,17 +1,24 @@
 # ~/formalities/src/formalities/frameworks/base.py
 from __future__ import annotations
 import typing as t
+from weakref import WeakValueDictionary
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from formalities.core.types.propositions import (
     Proposition, AtomicProposition, CompoundProposition
 )
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of framework validation containing boolean success status and any errors"""
     isvalid: bool
-    errors: list[str] = field(default_factory=list)
+    errors: t.Sequence[str] = field(default_factory=list)
+
+# Shared result for validations without errors, immutable all the way down
+VALIDRESULT = ValidationResult(True, ())
+
+# Dead entries are pruned from the compatibility results once they outgrow this (or twice the live ones)
+COMPATCACHELIMIT = 4096
 
 
 class Framework(ABC):
@@ -20,6 +27,8 @@ class Framework(ABC):
     A framework defines how logical statements ought to be interpreted and validated,
     according to specific philosophical & mathematical principles.
     """
+    _compatguard: WeakValueDictionary[int, Proposition]
+    _compatresults: dict[int, bool]
 
     @property
     @abstractmethod
@@ -66,9 +75,31 @@ class Framework(ABC):
         Raises:
             ValueError if proposition is not compatible
         """
-        if not self.iscompatible(proposition):
+        if not self._cachedcompatibility(proposition):
             raise ValueError(
                 f"""
                 Proposition {proposition} is not compatible with {self.name} framework.
                 """
             )
+
+    def _cachedcompatibility(self, proposition: Proposition) -> bool:
+        """Check compatibility once per proposition instance, propositions being immutable."""
+        # Created on first use so subclasses defining __init__ needn't chain up
+        try:
+            guard, results = self._compatguard, self._compatresults
+        except AttributeError:
+            # compatibility results by proposition id, the guard drops ids whose proposition has been collected
+            guard = self._compatguard = WeakValueDictionary()
+            results = self._compatresults = {}
+        key = id(proposition)
+        if guard.get(key) is proposition:
+            return results[key]
+        result = self.iscompatible(proposition)
+        try:
+            guard[key] = proposition
+        except TypeError: # not weak referenceable, so can't be cached safely
+            return result
+        if len(results) >= max(COMPATCACHELIMIT, 2 * len(guard)):
+            results = self._compatresults = {k: v for k, v in results.items() if k in guard}
+        results[key] = result
+        return result
@@ -1,16 +1,128 @@
 # ~/formalities/src/formalities/frameworks/simple.py
 from __future__ import annotations
 import typing as t
-from dataclasses import dataclass
-from formalities.frameworks.base import Framework, ValidationResult
+from dataclasses import dataclass, field
+from formalities.frameworks.base import Framework, ValidationResult, VALIDRESULT
 from formalities.core.types.propositions import (
     Proposition, AtomicProposition, CompoundProposition
 )
 from formalities.core.types.operators.boolean import (
     AND, OR, NOT, IMPLIES, IFF,
-    ANDN, ORN, NAND, NOR
+    ANDN, ORN, NAND, NOR,
+    XOR, NANDN, NORN
 )
 
+NOTSYMBOL = NOT().symbol
+# How the classical walk treats an operator, decided once per operator type
+INVALIDOPERATOR, VALIDOPERATOR, CONJUNCTION, NEGATION = range(4)
+# Opcodes of a compiled proposition
+ATOMOP, CONSTOP, NOTOP, ANDOP, OROP, IMPLIESOP, IFFOP, XOROP, NANDOP, NOROP = range(10)
+OPCODES: dict[type, int] = {
+    NOT: NOTOP, AND: ANDOP, ANDN: ANDOP, OR: OROP, ORN: OROP,
+    IMPLIES: IMPLIESOP, IFF: IFFOP, XOR: XOROP,
+    NAND: NANDOP, NANDN: NANDOP, NOR: NOROP, NORN: NOROP,
+}
+
+
+def opcode(operator) -> int:
+    """Look up the opcode for an operator by exact type, falling back to its nearest known base."""
+    if (code := OPCODES.get(type(operator))) is not None:
+        return code
+    for optype, code in OPCODES.items():
+        if isinstance(operator, optype):
+            return code
+    raise ValueError(f"Operator {operator.symbol} can't be compiled")
+
+
+def slotsjoined(arg: tuple[int, ...], operator: str) -> str:
+    return f" {operator} ".join(f"v{slot}" for slot in arg)
+
+# Kernel expression for each opcode, indexed by opcode, from the instruction's argument
+KERNELEXPRESSIONS: tuple[t.Callable[[t.Any], str], ...] = (
+    lambda arg: f"columns[{arg}]", # ATOMOP
+    lambda arg: ("mask" if arg else "0"), # CONSTOP
+    lambda arg: f"mask & ~v{arg[0]}", # NOTOP
+    lambda arg: slotsjoined(arg, "&"), # ANDOP
+    lambda arg: slotsjoined(arg, "|"), # OROP
+    lambda arg: f"mask & (~v{arg[0]} | v{arg[1]})", # IMPLIESOP
+    lambda arg: f"mask & ~(v{arg[0]} ^ v{arg[1]})", # IFFOP
+    lambda arg: f"v{arg[0]} ^ v{arg[1]}", # XOROP
+    lambda arg: f"mask & ~({slotsjoined(arg, '&')})", # NANDOP
+    lambda arg: f"mask & ~({slotsjoined(arg, '|')})", # NOROP
+)
+
+
+def buildkernel(instructions: t.Sequence[tuple[int, t.Any]]) -> t.Callable[[t.Sequence[int], int], int]:
+    """
+    Generate a function computing the value slots of compiled instructions one line at a time.
+    The function takes the atom columns and the mask of all rows, and returns the last slot.
+    """
+    lines = ["def kernel(columns, mask):"]
+    for i, (code, arg) in enumerate(instructions):
+        lines.append(f"    v{i} = {KERNELEXPRESSIONS[code](arg)}")
+    lines.append(f"    return v{len(instructions) - 1}")
+    namespace = {}
+    exec(compile("\n".join(lines), "<compiled proposition>", "exec"), namespace)
+    return namespace["kernel"]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledProposition:
+    """
+    A proposition flattened into a sequence of instructions over its distinct atoms.
+
+    Each instruction writes one value slot: ATOMOP pushes an atom column, CONSTOP a fixed truth value,
+    and operator codes combine earlier slots, so shared subformulas are computed once. The last slot
+    holds the result.
+
+    Values are evaluated as integer bitmasks with one bit per row of the truth table, so each
+    instruction runs once over every assignment at the same time. The instructions are turned into a
+    straight-line kernel function once, so evaluating doesn't dispatch on opcodes.
+    """
+    instructions: tuple[tuple[int, t.Any], ...]
+    atoms: tuple[str, ...]
+    kernel: t.Callable[[t.Sequence[int], int], int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'kernel', buildkernel(self.instructions))
+
+    def evaluate(self, context: dict[str, bool]) -> bool:
+        """Evaluate under a single assignment of the atoms."""
+        try:
+            return bool(self.kernel([int(bool(context[atom])) for atom in self.atoms], 1))
+        except KeyError as e:
+            raise ValueError(f"No truth value available for proposition: {e.args[0]}") from None
+
+    def truthmask(self) -> int:
+        """
+        Evaluate under every assignment of the atoms, as a bitmask of the rows where the proposition holds.
+        Row r assigns atom i the value of bit i of r, so row 0 has every atom False.
+        """
+        rows = 1 << len(self.atoms)
+        mask = (1 << rows) - 1
+        columns = []
+        for i in range(len(self.atoms)):
+            width = 1 << i
+            # a run of `width` set bits after `width` clear ones, repeated across all rows
+            columns.append((mask // ((1 << (2 * width)) - 1)) * (((1 << width) - 1) << width))
+        return self.kernel(columns, mask)
+
+    def evaluateall(self) -> list[bool]:
+        """Evaluate under every assignment of the atoms, one value per row as ordered by truthmask."""
+        result = self.truthmask()
+        return [bool((result >> row) & 1) for row in range(1 << len(self.atoms))]
+
+    def countsatisfying(self) -> int:
+        """Count the assignments under which the proposition holds."""
+        return self.truthmask().bit_count()
+
+    def issatisfiable(self) -> bool:
+        return self.truthmask() != 0
+
+    def istautology(self) -> bool:
+        return self.countsatisfying() == (1 << len(self.atoms))
+
+
 class ClassicalFramework(Framework):
     """
     Classical propositional logic framework.
@@ -20,35 +132,107 @@ class ClassicalFramework(Framework):
         - truth values are determined by truth tables
     """
     VALIDOPERATORS = (AND, OR, NOT, IMPLIES, IFF, ANDN, ORN, NAND, NOR)
+    OPERATORKINDS: dict[type, int] = {
+        AND: CONJUNCTION, NOT: NEGATION,
+        OR: VALIDOPERATOR, IMPLIES: VALIDOPERATOR, IFF: VALIDOPERATOR,
+        ANDN: VALIDOPERATOR, ORN: VALIDOPERATOR, NAND: VALIDOPERATOR, NOR: VALIDOPERATOR,
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        """Rebuild the operator kind table for subclasses that change VALIDOPERATORS."""
+        super().__init_subclass__(**kwargs)
+        cls.OPERATORKINDS = {optype: cls._classifyoperatortype(optype) for optype in cls.VALIDOPERATORS}
+
+    @classmethod
+    def _classifyoperatortype(cls, optype: type) -> int:
+        """Decide the kind of an operator type from VALIDOPERATORS."""
+        if not issubclass(optype, cls.VALIDOPERATORS):
+            return INVALIDOPERATOR
+        if issubclass(optype, AND):
+            return CONJUNCTION
+        if issubclass(optype, NOT):
+            return NEGATION
+        return VALIDOPERATOR
+
+    def _operatorkind(self, operator) -> int:
+        """Look up an operator's kind by exact type, classifying types outside the table on the fly."""
+        if (kind := self.OPERATORKINDS.get(type(operator))) is not None:
+            return kind
+        kind = self._classifyoperatortype(type(operator))
+        if (kind == VALIDOPERATOR) and (operator.symbol == NOTSYMBOL):
+            return NEGATION
+        return kind
+
     @property
     def name(self) -> str:
         return "Classical Proposition Logic"
 
-    def _containsconjunction(self, proposition: Proposition, p1: Proposition, p2: Proposition) -> bool:
-        """Check if proposition contains a conjunction of p1 and p2"""
-        if isinstance(proposition, CompoundProposition):
-            if isinstance(proposition.operator, AND):
-                comps = set(proposition.components)
-                if (p1 in comps) and (p2 in comps):
-                    return True
-            return any(
-                self._containsconjunction(comp, p1, p2)
-                for comp in proposition.components
-            )
-        return False
-
     def iscompatible(self, proposition: Proposition) -> bool:
         """Check if proposition uses only classical operators."""
+        return self._walk(proposition, None)
+
+    def _walk(self, proposition: Proposition, contradictions: t.Optional[set[Proposition]]) -> bool:
+        """
+        Check compatibility and, when contradictions is given, collect every atom conjoined with its own negation.
+
+        Walks an explicit stack, so deep propositions don't hit the recursion limit, and visits each distinct
+        subformula once, keyed by node identity. Every child's operator is checked before descending into any
+        of them, so an unsupported operator beside a large sibling is rejected without walking the sibling.
+        """
         if isinstance(proposition, AtomicProposition):
             return True
-        if isinstance(proposition, CompoundProposition):
-            if not isinstance(proposition.operator, self.VALIDOPERATORS):
-                return False
-            return all(
-                self.iscompatible(comp)
-                for comp in proposition.components
-            )
-        return False
+        if not isinstance(proposition, CompoundProposition) or ((kind := self._operatorkind(proposition.operator)) == INVALIDOPERATOR):
+            return False
+        visited = {id(proposition)}
+        stack = [(proposition, kind)]
+        while stack:
+            node, kind = stack.pop()
+            components = node.components
+            if (contradictions is not None) and (kind == CONJUNCTION):
+                comps = set(components)
+                for comp in components:
+                    if isinstance(comp, CompoundProposition) and (self._operatorkind(comp.operator) == NEGATION):
+                        negated = comp.components[0]
+                        if (not isinstance(negated, CompoundProposition)) and (negated in comps):
+                            contradictions.add(negated)
+            for comp in components:
+                if isinstance(comp, AtomicProposition) or ((key := id(comp)) in visited):
+                    continue
+                if not isinstance(comp, CompoundProposition) or ((compkind := self._operatorkind(comp.operator)) == INVALIDOPERATOR):
+                    return False
+                visited.add(key)
+                stack.append((comp, compkind))
+        return True
+
+    def compile(self, proposition: Proposition) -> CompiledProposition:
+        """
+        Compile a compatible proposition for repeated or truth table evaluation.
+        Atoms with a fixed truth value, or that don't read the context, compile to constants.
+        """
+        self.validatecompatibility(proposition)
+        instructions, atoms, slots, atomindex = [], [], {}, {}
+        stack = [(proposition, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in slots:
+                continue
+            if isinstance(node, AtomicProposition):
+                if (node._truthvalue is not None) or (type(node).evaluate is not AtomicProposition.evaluate):
+                    instruction = (CONSTOP, node.evaluate(None))
+                else:
+                    if (index := atomindex.get(node.symbol)) is None:
+                        index = atomindex[node.symbol] = len(atoms)
+                        atoms.append(node.symbol)
+                    instruction = (ATOMOP, index)
+            elif not expanded:
+                stack.append((node, True))
+                stack.extend((comp, False) for comp in reversed(node.components))
+                continue
+            else:
+                instruction = (opcode(node.operator), tuple(slots[id(comp)] for comp in node.components))
+            slots[id(node)] = len(instructions)
+            instructions.append(instruction)
+        return CompiledProposition(tuple(instructions), tuple(atoms))
 
     def validate(self, proposition: Proposition) -> ValidationResult:
         """
@@ -60,21 +244,17 @@ class ClassicalFramework(Framework):
         """
         errors = []
 
-        if not self.iscompatible(proposition):
+        # one walk covers operator support and direct contradictions
+        contradictions = set()
+        if not self._walk(proposition, contradictions):
             errors.append(f"Proposition contains operators not supported in classical logic") # this could be more specific about which operators
             return ValidationResult(False, errors)
 
-        # check for contradictions
-        if isinstance(proposition, CompoundProposition):
-            # check for direct contradictions
-            for atom in (atoms:=proposition.atoms):
-                notatom = CompoundProposition(NOT(), (atom,))
-                if self._containsconjunction(proposition, atom, notatom):
-                    errors.append(f"Contradiction found: conjunction of {atom} and {NOT.symbol}{atom}")
-        return ValidationResult(
-            (len(errors)==0),
-            errors
-        )
+        for atom in contradictions:
+            errors.append(f"Contradiction found: conjunction of {atom} and {NOTSYMBOL}{atom}")
+        if not errors:
+            return VALIDRESULT
+        return ValidationResult(False, errors)
 
     def evaluate(self, proposition: Proposition, context: t.Optional[dict[str, bool]] = None) -> bool:
         self.validatecompatibility(proposition)
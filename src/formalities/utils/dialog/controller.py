@@ -2,12 +2,19 @@
 from __future__ import annotations
 import typing as t
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from formalities.utils.toolcalls import toolcallhandler, ToolCallRequest, ToolCallResponse
 from formalities.utils.dialog.state import DialogState, DialogStage, ErrorType
 from loguru import logger as log
 
+# Tool calls the controller can handle, by tool name
+TOOLDISPATCH: dict[str, t.Callable[[dict], ToolCallResponse]] = {
+    "matchmaker": toolcallhandler._matchmaker,
+    "methodbuilder": toolcallhandler._methodbuilder,
+}
+
 class DialogAction(Enum):
     CONTINUE = auto()
     RETRY = auto()
@@ -16,14 +23,14 @@ class DialogAction(Enum):
     TERMINATE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogRequest:
     content: str
     role: str = "user"
     metadata: dict[str, t.Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogResponse:
     content: str
     action: DialogAction = DialogAction.CONTINUE
@@ -54,50 +61,59 @@ class DialogController:
     def __init__(self):
         self.state = DialogState()
         self.strategies: list[DialogStrategy] = []
+        # strategies bucketed by the stages they handle, in registration order
+        self._stagestrategies: defaultdict[DialogStage, list[DialogStrategy]] = defaultdict(list)
 
     def registerstrategy(self, strategy: DialogStrategy) -> None:
         self.strategies.append(strategy)
+        for stage in strategy.handleablestages:
+            self._stagestrategies[stage].append(strategy)
         #log.info(f"Registered strategy: {strategy.name}")
 
+    def _selectstrategy(self, stage: DialogStage) -> t.Optional[DialogStrategy]:
+        """The first strategy registered for stage that can handle the current state."""
+        for strategy in self._stagestrategies.get(stage, ()):
+            if strategy.canhandle(self.state):
+                return strategy
+        return None
+
     def processrequest(self, request: DialogRequest) -> DialogResponse:
         self.state.history.addexchange(request.role, request.content, request.metadata)
-        for strategy in self.strategies:
-            if strategy.canhandle(self.state):
-                log.info(f"Applying strategy: {strategy.name} for stage: {self.state.stage.name}")
-                try:
-                    response = strategy.apply(self.state, request)
-                    self.state.history.addexchange("system", response.content, response.metadata)
-                    return response
-                except Exception as e:
-                    log.exception(f"Error in strategy {strategy.name}: {str(e)}")
-                    self.state.seterror(e)
-                    # Retry with error handling strategy
-                    for errorstrategy in self.strategies:
-                        if DialogStage.ERRORHANDLING in errorstrategy.handleablestages:
-                            return errorstrategy.apply(self.state, request)
-                    # If no error handling strategy, return fallback
-                    return DialogResponse(
-                        content=f"An error occurred: {str(e)}",
-                        action=DialogAction.FALLBACK
-                    )
-
-        log.warning(f"No strategy found for stage: {self.state.stage.name}")
+        if (strategy := self._selectstrategy(self.state.stage)) is not None:
+            log.info("Applying strategy: {} for stage: {}", strategy.name, self.state.stage.name)
+            try:
+                response = strategy.apply(self.state, request)
+                self.state.history.addexchange("system", response.content, response.metadata)
+                return response
+            except Exception as e:
+                log.exception(f"Error in strategy {strategy.name}: {str(e)}")
+                self.state.seterror(e)
+                # Retry with error handling strategy
+                if (errorstrategy := self._selectstrategy(DialogStage.ERRORHANDLING)) is not None:
+                    return errorstrategy.apply(self.state, request)
+                # If no error handling strategy, return fallback
+                return DialogResponse(
+                    content=f"An error occurred: {str(e)}",
+                    action=DialogAction.FALLBACK
+                )
+
+        log.warning("No strategy found for stage: {}", self.state.stage.name)
         return DialogResponse(
             content="I'm not sure how to proceed at this stage.",
             action=DialogAction.FALLBACK
         )
 
+    @classmethod
+    def registertool(cls, name: str, handler: t.Callable[[dict], ToolCallResponse]) -> None:
+        """Register a handler for tool calls named `name`, taking the call args and returning a ToolCallResponse."""
+        TOOLDISPATCH[name] = handler
+
     def handletoolcall(self, name: str, args: dict) -> t.Any:
-        log.info(f"Handling tool call: {name} with args: {args}")
+        log.info("Handling tool call: {} with args: {}", name, args)
         try:
-            response = None
-            match name:
-                case "matchmaker":
-                    response = toolcallhandler._matchmaker(args)
-                case "methodbuilder":
-                    response = toolcallhandler._methodbuilder(args)
-                case _:
-                    raise ValueError(f"Unknown tool: {name}")
+            if (handler := TOOLDISPATCH.get(name)) is None:
+                raise ValueError(f"Unknown tool: {name}")
+            response = handler(args)
 
             rdata = response.data if response.success else {"error": response.error}
             self.state.memory.addtoolcall(name, args, rdata, response.success)
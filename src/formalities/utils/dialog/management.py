@@ -1,20 +1,29 @@
 # ~/formalities/src/formalities/utils/dialog/management.py
 from __future__ import annotations
 import typing as t
+from collections import deque
 from dataclasses import dataclass, field
 from formalities.utils.dialog.state import DialogState, DialogStage, ErrorType
 from loguru import logger as log
 
+# How many of the most recent error types pattern detection looks back over
+ERRORWINDOW = 10
 
-@dataclass
+
+@dataclass(slots=True)
 class ErrorPattern:
     """Pattern to detect in error sequences"""
-    errortypes: list[ErrorType]
+    errortypes: tuple[ErrorType, ...]
     count: int = 1
     timewindow: int = 5  # Number of interactions to consider
+    signature: bytes = field(init=False, repr=False, compare=False)  # errortypes as bytes, for substring search
+
+    def __post_init__(self) -> None:
+        self.errortypes = tuple(self.errortypes)
+        self.signature = bytes(errortype.value for errortype in self.errortypes)
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryPath:
     """Tracks a sequence of actions to recover from errors"""
     initialerrortype: ErrorType
@@ -50,7 +59,7 @@ class StateManager:
         self.errorpatterns = {}  # Pattern name -> ErrorPattern
         self.recoveryhistory: list[RecoveryPath] = []
         self.currentrecovery: t.Optional[RecoveryPath] = None
-        self._originaltransition = None  # Store original transition method
+        self._recenterrortypes: deque[ErrorType] = deque(maxlen=ERRORWINDOW)
 
         # Register common error patterns
         self._registercommonpatterns()
@@ -86,31 +95,21 @@ class StateManager:
             return []
 
         detected = []
-        recentcalls = self.state.memory.toolcalls[-10:] if len(self.state.memory.toolcalls) > 0 else []
-
-        # Extract error types from recent failures
-        recenterrortypes = []
-        for call in recentcalls:
-            if not call["success"] and "exception" in call["result"]:
-                errortype = self.state.DetectErrorType(call["result"]["exception"])
-                recenterrortypes.append(errortype)
+        recenterrortypes = list(self._recenterrortypes)
+        recentsignature = bytes(errortype.value for errortype in recenterrortypes)
 
         # Check each pattern
         for name, pattern in self.errorpatterns.items():
-            window = recenterrortypes[-pattern.timewindow:] if len(recenterrortypes) >= pattern.timewindow else recenterrortypes
+            window = recenterrortypes[-pattern.timewindow:]
 
             # Simple repeated error check
-            if len(pattern.errortypes) == 1 and pattern.errortypes[0] in window:
+            if len(pattern.errortypes) == 1:
                 if window.count(pattern.errortypes[0]) >= pattern.count:
                     detected.append(name)
 
             # Sequence pattern check
-            elif len(pattern.errortypes) > 1:
-                # Check if the sequence appears in the window
-                for i in range(len(window) - len(pattern.errortypes) + 1):
-                    if window[i:i+len(pattern.errortypes)] == pattern.errortypes:
-                        detected.append(name)
-                        break
+            elif pattern.signature in recentsignature[-pattern.timewindow:]:
+                detected.append(name)
 
         return detected
 
@@ -121,7 +120,7 @@ class StateManager:
         Args:
             pattern: Name of the detected pattern
         """
-        log.info(f"Handling error pattern: {pattern}")
+        log.info("Handling error pattern: {}", pattern)
 
         if pattern == "repeatedimport":
             # Suggest broader component suggestions
@@ -142,14 +141,14 @@ class StateManager:
             # New error, start tracking recovery
             errortype, _ = self.state.error
             self.currentrecovery = RecoveryPath(initialerrortype=errortype)
-            log.debug(f"Started tracking recovery for {errortype.name}")
+            log.debug("Started tracking recovery for {}", errortype.name)
 
         elif not self.state.error and self.currentrecovery:
             # Error resolved, complete recovery path
             self.currentrecovery.markcomplete()
             self.recoveryhistory.append(self.currentrecovery)
             self.currentrecovery = None
-            log.debug(f"Completed recovery path")
+            log.debug("Completed recovery path")
 
     def addrecoverystep(self, action: str, result: bool, context: dict = None) -> None:
         """
@@ -162,7 +161,7 @@ class StateManager:
         """
         if self.currentrecovery:
             self.currentrecovery.addstep(action, result, context)
-            log.debug(f"Added recovery step: {action}, success={result}")
+            log.debug("Added recovery step: {}, success={}", action, result)
 
     def handlestatetransition(self, newstage: DialogStage) -> None:
         """
@@ -183,6 +182,8 @@ class StateManager:
 
         elif newstage == DialogStage.ERRORHANDLING:
             # Transitioning to error handling
+            if self.state.error:
+                self._recenterrortypes.append(self.state.error[0])
             patterns = self.detecterrorpatterns()
             for pattern in patterns:
                 self.handleerrorpattern(pattern)
@@ -198,23 +199,5 @@ def initialize(state: DialogState) -> None:
     """Initialize the state manager with a dialog state"""
     global statemanager
     statemanager = StateManager(state)
-    statemanager.state = state
-
-    # Store original transition method
-    original_transition = state.transitionto
-    statemanager._originaltransition = original_transition
-
-    # Define the enhanced transition function
-    def enhancedtransition(newstage: DialogStage) -> None:
-        """Enhanced transition that uses state manager logic"""
-        # Process transition with state manager
-        statemanager.handlestatetransition(newstage)
-
-        # Call original transition method to avoid recursion
-        oldstage = state.stage
-        state.stage = newstage  # Directly set the stage
-        log.info(f"Dialog state transition: {oldstage.name} -> {newstage.name}")
-
-    # Replace the method
-    state.transitionto = enhancedtransition
+    state._manager = statemanager
     #log.info("Initialized state manager")
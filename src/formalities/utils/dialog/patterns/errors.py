@@ -1,15 +1,69 @@
 # ~/formalities/src/formalities/utils/dialog/patterns/errors.py
 from __future__ import annotations
-import re, inspect, traceback, typing as t
-from dataclasses import dataclass, field
-from importlib import import_module
-from pathlib import Path
-from formalities.utils.dialog.state import DialogState, ErrorType
+import os, copy, inspect, traceback, types, typing as t
+try:
+    import regex as re # avoids the quadratic rescans re falls into on long messages
+except ImportError:
+    import re
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from formalities.utils.dialog.state import DialogState, ErrorType, ERRORTYPENAMES
 from formalities.utils.discovery import frameworkregistry, ComponentInfo
+from formalities.validation.base import ValidationError
 from loguru import logger as log
 
+# Patterns pulled out of exception messages
+CLASSPATTERN = re.compile(r'([\'"`])([A-Za-z0-9_]+)\1') # name in matching quotes or backticks
+MODULEPATTERN = re.compile(r'[\'"]([A-Za-z0-9_\.]+)[\'"]')
+TYPEPATTERN = re.compile(r'([A-Za-z0-9_]+) object')
+REQUIRESPATTERN = re.compile(r'requires ([^.]+)')
+REQUIREPATTERN = re.compile(r'requires? ([^\.]+)')
+INVALIDPATTERN = re.compile(r'invalid ([^\.]+)')
+# Exception names (less 'error') too generic to look components up by
+STOPWORDS = frozenset({'value', 'key', 'index', 'name', 'type', 'attribute'})
+# provided or expected type, as a lookahead so overlapping mentions are each seen as separate searches would
+TYPEMENTIONPATTERN = re.compile(r'(?=(?:(?P<got>Got)|(?P<expected>[Ee]xpected)):?\s+(?P<typename>[A-Za-z0-9_\.]+))')
+
+# Analyses already made, keyed by what analysis reads from an exception (see analysiskey) so no exception or
+# frame is kept alive; callers get copies, never the cached objects
+ANALYSISLIMIT = 32
+CONTEXTCACHE: OrderedDict[tuple, ErrorContext] = OrderedDict()
+ANALYSISCACHE: OrderedDict[tuple, dict[str, t.Any]] = OrderedDict()
+
+# Related components and suggestions, keyed by (errortype, keywords, registry generation) so exceptions differing
+# only in details the keywords skip (numbers, short or repeated names, raise site) share them
+COMPONENTLIMIT = 256
+COMPONENTCACHE: OrderedDict[tuple[ErrorType, frozenset[str], int], tuple[tuple[ComponentInfo, ...], tuple[str, ...]]] = OrderedDict()
+
+
+def analysiskey(exception: Exception, errortype: ErrorType) -> t.Optional[tuple]:
+    """
+    Everything analysis reads from an exception: its type, message and innermost frame location,
+    with the registry generation its components came from. None when analysis reads more than that.
+    """
+    if isinstance(exception, ValidationError) and hasattr(exception, 'context'): # carries its own context
+        return None
+    try:
+        message = str(exception)
+    except Exception:
+        return None
+    return (errortype, type(exception), message, lastframe(exception.__traceback__), frameworkregistry.generation)
+
+
+def cachedanalysis(cache: OrderedDict, key: t.Optional[tuple], analyze: t.Callable[[], t.Any]) -> t.Any:
+    """Return the cached analysis under key, running analyze on a miss; uncached when key is None."""
+    if key is None:
+        return analyze()
+    if (result := cache.get(key)) is not None:
+        cache.move_to_end(key)
+        return result
+    result = cache[key] = analyze()
+    if len(cache) > ANALYSISLIMIT:
+        cache.popitem(last=False)
+    return result
 
-@dataclass
+
+@dataclass(slots=True)
 class ErrorContext:
     """
     Context information about an error, providing validation context
@@ -18,10 +72,30 @@ class ErrorContext:
     errortype: ErrorType
     message: str
     exceptiontype: str
-    traceback: str
-    relatedcomponents: list[ComponentInfo] = field(default_factory=list)
-    suggestions: list[str] = field(default_factory=list)
-    validationcontext: dict[str, t.Any] = field(default_factory=dict)
+    # None when not given; the analyzer always fills them in
+    relatedcomponents: t.Optional[list[ComponentInfo]] = None
+    suggestions: t.Optional[list[str]] = None
+    validationcontext: t.Optional[dict[str, t.Any]] = None
+    exception: t.Optional[BaseException] = field(default=None, repr=False, compare=False)
+    _traceback: t.Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def traceback(self) -> str:
+        """The formatted traceback of the exception, formatted on first access."""
+        if self._traceback is None:
+            exception = self.exception
+            self._traceback = ''.join(traceback.format_exception(type(exception), exception, exception.__traceback__)) if (exception is not None) else ""
+        return self._traceback
+
+
+def lastframe(tb: t.Optional[types.TracebackType]) -> t.Optional[tuple[str, int, str]]:
+    """The (filename, line, function) of the innermost frame of a traceback, without extracting the others."""
+    if tb is None:
+        return None
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    code = tb.tb_frame.f_code
+    return code.co_filename, tb.tb_lineno, code.co_name
 
 
 class ErrorAnalyzer:
@@ -31,64 +105,71 @@ class ErrorAnalyzer:
     """
 
     @staticmethod
-    def extractframeworkcomponents(exception: Exception) -> list[ComponentInfo]:
-        """
-        Extract potentially relevant framework components based on the exception.
+    def extractkeywords(exception: Exception, errorstr: t.Optional[str] = None) -> frozenset[str]:
+        """Extract the keywords framework components are looked up by for the exception."""
+        if errorstr is None:
+            errorstr = str(exception)
 
-        This provides context about available components without prescribing
-        specific implementations.
-        """
-        components = []
-        errorstr = str(exception)
-
-        # Extract keywords that might be relevant to the error
+        # Extract keywords that might be relevant to the error, skipping very short ones as they come in
         keywords = set()
 
-        # Add exception type as a keyword
-        keywords.add(type(exception).__name__.lower().replace('error', ''))
+        def addkeyword(word: str) -> None:
+            if len(lowered := word.lower()) > 3:
+                keywords.add(lowered)
+
+        # Add exception type as a keyword, unless it only names a generic error like ValueError or KeyError
+        if (exceptionkeyword := type(exception).__name__.lower().replace('error', '')) not in STOPWORDS:
+            addkeyword(exceptionkeyword)
 
         # Extract potential class/module names from error message
-        classpattern = r'\'([A-Za-z0-9_]+)\'|\"([A-Za-z0-9_]+)\"|`([A-Za-z0-9_]+)`'
-        for match in re.finditer(classpattern, errorstr):
-            matched = match.group(1) or match.group(2) or match.group(3)
-            if matched:
-                keywords.add(matched.lower())
+        for match in CLASSPATTERN.finditer(errorstr):
+            addkeyword(match.group(2))
 
         # If it's an ImportError or ModuleNotFoundError, extract the module name
         if isinstance(exception, ImportError) or isinstance(exception, ModuleNotFoundError):
             # Pattern to match "No module named 'X'" or similar
-            modulepattern = r'[\'"]([A-Za-z0-9_\.]+)[\'"]'
-            matches = re.findall(modulepattern, errorstr)
+            matches = MODULEPATTERN.findall(errorstr)
             for match in matches:
                 parts = match.split('.')
                 for part in parts:
-                    keywords.add(part.lower())
+                    addkeyword(part)
 
         # If it's a TypeError, extract potential type names
         if isinstance(exception, TypeError):
             # Look for type names in the error message
-            typepattern = r'([A-Za-z0-9_]+) object'
-            matches = re.findall(typepattern, errorstr)
+            matches = TYPEPATTERN.findall(errorstr)
             for match in matches:
-                keywords.add(match.lower())
+                addkeyword(match)
+
+        return frozenset(keywords)
 
-        # Query framework registry for relevant components
+    @staticmethod
+    def componentsfor(keywords: t.Iterable[str]) -> list[ComponentInfo]:
+        """Query the framework registry for up to 5 distinct components matching the keywords."""
+        # Query framework registry for relevant components, deduplicated by name as they come in
+        components: dict[str, ComponentInfo] = {}
         for keyword in keywords:
-            if len(keyword) > 3:  # Avoid very short keywords
-                components.extend(frameworkregistry.query(keyword=keyword))
+            for component in frameworkregistry.querykeyword(keyword):
+                components.setdefault(component.name, component)
+            if len(components) >= 5:
+                break
 
-        # Deduplicate and return
-        uniquecomponents = []
-        seen = set()
-        for component in components:
-            if component.name not in seen:
-                seen.add(component.name)
-                uniquecomponents.append(component)
+        return list(components.values())[:5]  # Limit to top 5 most relevant
 
-        return uniquecomponents[:5]  # Limit to top 5 most relevant
+    @classmethod
+    def extractframeworkcomponents(cls, exception: Exception, errorstr: t.Optional[str] = None) -> list[ComponentInfo]:
+        """
+        Extract potentially relevant framework components based on the exception.
+
+        This provides context about available components without prescribing
+        specific implementations.
+        """
+        if not frameworkregistry: # nothing to find, so don't extract keywords to look for
+            return []
+        return cls.componentsfor(cls.extractkeywords(exception, errorstr))
 
     @staticmethod
-    def extractvalidationcontext(exception: Exception) -> dict[str, t.Any]:
+    def extractvalidationcontext(exception: Exception, errorstr: t.Optional[str] = None) -> dict[str, t.Any]:
         """
         Extract validation context from the exception to provide
         information about what constraints were violated.
@@ -96,36 +177,31 @@ class ErrorAnalyzer:
         context = {}
 
         # Check for validation-specific exceptions
-        try:
-            ValidationError = import_module('formalities.validation.base').ValidationError
-            if isinstance(exception, ValidationError) and hasattr(exception, 'context'):
-                return exception.context
-        except (ImportError, AttributeError):
-            pass
+        if isinstance(exception, ValidationError) and hasattr(exception, 'context'):
+            return exception.context
 
         # Try to extract validation information from the exception message
-        errorstr = str(exception)
+        if errorstr is None:
+            errorstr = str(exception)
 
         # Look for constraint mentions
         if "requires" in errorstr:
-            reqpattern = r'requires ([^.]+)'
-            matches = re.findall(reqpattern, errorstr)
+            matches = REQUIRESPATTERN.findall(errorstr)
             if matches:
                 context["requirements"] = matches
 
         # Look for validation errors
-        if "invalid" in errorstr.lower() or "validation" in errorstr.lower():
+        if ("invalid" in (lowered := errorstr.lower())) or ("validation" in lowered):
             context["validation_error"] = errorstr
 
         # Add traceback information that might help understand the context
-        tb = traceback.extract_tb(exception.__traceback__)
-        if tb:
+        if (frame := lastframe(exception.__traceback__)) is not None:
             # Get the module where the error occurred
-            failed_module = tb[-1].filename
+            failed_module, linenumber, function = frame
             context["error_location"] = {
-                "file": Path(failed_module).name,
-                "line": tb[-1].lineno,
-                "function": tb[-1].name
+                "file": os.path.basename(failed_module),
+                "line": linenumber,
+                "function": function
             }
 
         return context
@@ -136,6 +212,10 @@ class ErrorAnalyzer:
         Generate suggestions about available components that might be relevant.
         These suggestions provide information without prescribing specific implementations.
         """
+        # Only type errors suggest anything without components to draw on
+        if (not relatedcomponents) and (errortype != ErrorType.TYPEERROR):
+            return []
+
         suggestions = []
 
         if errortype == ErrorType.IMPORTERROR:
@@ -169,6 +249,19 @@ class ErrorAnalyzer:
 
         return suggestions
 
+    @classmethod
+    def componentanalysis(cls, errortype: ErrorType, keywords: frozenset[str]) -> tuple[tuple[ComponentInfo, ...], tuple[str, ...]]:
+        """The related components and suggestions for an error type and keywords, cached until the registry changes."""
+        key = (errortype, keywords, frameworkregistry.generation)
+        if (entry := COMPONENTCACHE.get(key)) is not None:
+            COMPONENTCACHE.move_to_end(key)
+            return entry
+        relatedcomponents = cls.componentsfor(keywords)
+        entry = COMPONENTCACHE[key] = (tuple(relatedcomponents), tuple(cls.generatesuggestedcomponents(errortype, relatedcomponents)))
+        if len(COMPONENTCACHE) > COMPONENTLIMIT:
+            COMPONENTCACHE.popitem(last=False)
+        return entry
+
     @classmethod
     def analyzeexception(cls, exception: Exception, errortype: ErrorType) -> ErrorContext:
         """
@@ -181,27 +274,37 @@ class ErrorAnalyzer:
         Returns:
             ErrorContext with validation context and available components
         """
+        # the cached context holds no exception, each caller gets its own copy pointing at theirs
+        context = cachedanalysis(CONTEXTCACHE, analysiskey(exception, errortype), lambda: replace(cls._analyzeexception(exception, errortype), exception=None))
+        return replace(
+            context,
+            relatedcomponents=(list(context.relatedcomponents) if context.relatedcomponents is not None else None),
+            suggestions=(list(context.suggestions) if context.suggestions is not None else None),
+            validationcontext=copy.deepcopy(context.validationcontext),
+            exception=exception
+        )
+
+    @classmethod
+    def _analyzeexception(cls, exception: Exception, errortype: ErrorType) -> ErrorContext:
         try:
-            # Extract the traceback as a string for context
-            tbstr = ''.join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+            errorstr = str(exception)
 
-            # Extract related framework components
-            relatedcomponents = cls.extractframeworkcomponents(exception)
+            # Extract related framework components and generate suggestions, shared by every exception
+            # that reads the same keywords
+            keywords = cls.extractkeywords(exception, errorstr) if frameworkregistry else frozenset()
+            relatedcomponents, suggestions = cls.componentanalysis(errortype, keywords)
 
             # Extract validation context
-            validationcontext = cls.extractvalidationcontext(exception)
-
-            # Generate suggestions
-            suggestions = cls.generatesuggestedcomponents(errortype, relatedcomponents)
+            validationcontext = cls.extractvalidationcontext(exception, errorstr)
 
             return ErrorContext(
                 errortype=errortype,
-                message=str(exception),
+                message=errorstr,
                 exceptiontype=type(exception).__name__,
-                traceback=tbstr,
-                relatedcomponents=relatedcomponents,
-                suggestions=suggestions,
-                validationcontext=validationcontext
+                relatedcomponents=list(relatedcomponents),
+                suggestions=list(suggestions),
+                validationcontext=validationcontext,
+                exception=exception # traceback is formatted from it when read
             )
         except Exception as e:
             log.error(f"Error analyzing exception: {str(e)}")
@@ -210,8 +313,8 @@ class ErrorAnalyzer:
                 errortype=errortype,
                 message=str(exception),
                 exceptiontype=type(exception).__name__,
-                traceback=str(exception),
-                suggestions=["Error occurred during exception analysis"]
+                suggestions=["Error occurred during exception analysis"],
+                _traceback=str(exception)
             )
 
 
@@ -227,8 +330,7 @@ class ImportErrorAnalyzer:
         result = {"errortype": "import_error"}
 
         # Extract the name that failed to import
-        namepattern = r'[\'"]([A-Za-z0-9_\.]+)[\'"]'
-        matches = re.findall(namepattern, str(exception))
+        matches = MODULEPATTERN.findall(str(exception))
         if matches:
             imported_name = matches[0]
             result["failed_import"] = imported_name
@@ -239,7 +341,7 @@ class ImportErrorAnalyzer:
 
             for part in parts:
                 if len(part) > 3:  # Avoid very short names
-                    similar = frameworkregistry.query(keyword=part)
+                    similar = frameworkregistry.querykeyword(part)
                     similarcomponents.extend(similar)
 
             if similarcomponents:
@@ -268,32 +370,33 @@ class TypeErrorAnalyzer:
         errorstr = str(exception)
 
         # Check for common patterns in type errors
-        gotpattern = r'Got:?\s+([A-Za-z0-9_\.]+)'
-        expectedpattern = r'[Ee]xpected:?\s+([A-Za-z0-9_\.]+)'
-
-        gotmatch = re.search(gotpattern, errorstr)
-        expectedmatch = re.search(expectedpattern, errorstr)
+        providedtype = expectedtype = None
+        for match in TYPEMENTIONPATTERN.finditer(errorstr): # first mention of each wins
+            if match.group('got'):
+                providedtype = providedtype or match.group('typename')
+            else:
+                expectedtype = expectedtype or match.group('typename')
+            if providedtype and expectedtype:
+                break
 
-        if gotmatch:
-            result["providedtype"] = gotmatch.group(1)
+        if providedtype:
+            result["providedtype"] = providedtype
 
-        if expectedmatch:
-            result["expectedtype"] = expectedmatch.group(1)
+        if expectedtype:
+            result["expectedtype"] = expectedtype
 
         # Analyze class/interface information
         if hasattr(exception, '__traceback__'):
-            tb = traceback.extract_tb(exception.__traceback__)
-            if tb:
-                lastframe = tb[-1]
+            if (frame := lastframe(exception.__traceback__)) is not None:
                 try:
                     # Extract the module and line where the error occurred
-                    module_name = lastframe.filename.split('/')[-1].replace('.py', '')
-                    linenumber = lastframe.lineno
+                    filename, linenumber, function = frame
+                    module_name = os.path.splitext(os.path.basename(filename))[0]
 
                     result["location"] = {
                         "module": module_name,
                         "line": linenumber,
-                        "function": lastframe.name
+                        "function": function
                     }
                 except Exception:
                     pass
@@ -315,21 +418,20 @@ class ValidationErrorAnalyzer:
         # Extract error message
         errorstr = str(exception)
         result["message"] = errorstr
+        lowered = errorstr.lower()
 
         # Look for specific constraints in the error message
         constraints = []
 
         # Check for requirements
-        if "require" in errorstr.lower():
-            reqpattern = r'requires? ([^\.]+)'
-            matches = re.findall(reqpattern, errorstr)
+        if "require" in lowered:
+            matches = REQUIREPATTERN.findall(errorstr)
             if matches:
                 constraints.extend(matches)
 
         # Check for invalid values
-        if "invalid" in errorstr.lower():
-            invalidpattern = r'invalid ([^\.]+)'
-            matches = re.findall(invalidpattern, errorstr)
+        if "invalid" in lowered:
+            matches = INVALIDPATTERN.findall(errorstr)
             if matches:
                 constraints.extend([f"must not have invalid {m}" for m in matches])
 
@@ -374,6 +476,10 @@ class ErrorContextProvider:
         Returns:
             Dictionary with specialized error analysis
         """
+        return copy.deepcopy(cachedanalysis(ANALYSISCACHE, analysiskey(exception, errortype), lambda: cls._geterroranalysis(exception, errortype)))
+
+    @classmethod
+    def _geterroranalysis(cls, exception: Exception, errortype: ErrorType) -> dict[str, t.Any]:
         if errortype == ErrorType.IMPORTERROR and isinstance(exception, ImportError):
             return ImportErrorAnalyzer.analyze(exception)
 
@@ -385,7 +491,7 @@ class ErrorContextProvider:
 
         # Default analysis
         return {
-            "errortype": errortype.name.lower(),
+            "errortype": ERRORTYPENAMES[errortype],
             "message": str(exception),
             "exceptiontype": type(exception).__name__
         }
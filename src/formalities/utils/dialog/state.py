@@ -1,9 +1,12 @@
 # ~/formalities/src/formalities/utils/dialog/state.py
 from __future__ import annotations
-import sys, importlib, typing as t
+import sys, importlib, itertools, typing as t
+from collections import deque
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from loguru import logger as log
+if t.TYPE_CHECKING:
+    from formalities.utils.dialog.management import StateManager
 
 class DialogStage(Enum):
     INITIALIZATION = auto()
@@ -26,30 +29,58 @@ class ErrorType(Enum):
     EXECUTIONERROR = auto()
     UNKNOWNERROR = auto()
 
-@dataclass
+# Lowercased error type names, computed once per member rather than on every analysis
+ERRORTYPENAMES: dict[ErrorType, str] = {e: sys.intern(e.name.lower()) for e in ErrorType}
+
+# Error types already classified, by exception type
+ERRORTYPES: dict[type, ErrorType] = {}
+# Custom framework errors recognised by name: (error name suffix, exception name, error type), checked in order
+NAMEDERRORTYPES: tuple[tuple[str, str, ErrorType], ...] = (
+    ('ValidationError', 'ValidationException', ErrorType.VALIDATIONFAILED),
+    ('FrameworkError', 'FrameworkException', ErrorType.FRAMEWORKINCOMPATIBLE),
+    ('PropositionError', 'PropositionException', ErrorType.PROPOSITIONINVALID),
+)
+
+@dataclass(slots=True)
 class DialogMemory:
     propositions: dict[str, t.Any] = field(default_factory=dict)
     frameworks: dict[str, t.Any] = field(default_factory=dict)
     validationresults: list[t.Any] = field(default_factory=list)
-    toolcalls: list[dict[str, t.Any]] = field(default_factory=list)
+    # tool calls are kept as parallel columns, one entry per call
+    toolcallnames: list[str] = field(default_factory=list)
+    toolcallargs: list[dict] = field(default_factory=list)
+    toolcallresults: list[t.Any] = field(default_factory=list)
+    toolcallsuccesses: list[bool] = field(default_factory=list)
     variables: dict[str, t.Any] = field(default_factory=dict)
 
     def addtoolcall(self, name: str, args: dict, result: t.Any, success: bool) -> None:
-        self.toolcalls.append({
-            "name": name,
-            "args": args,
-            "result": result,
-            "success": success
-        })
+        self.toolcallnames.append(name)
+        self.toolcallargs.append(args)
+        self.toolcallresults.append(result)
+        self.toolcallsuccesses.append(success)
+
+    def _toolcall(self, index: int) -> dict:
+        return {
+            "name": self.toolcallnames[index],
+            "args": self.toolcallargs[index],
+            "result": self.toolcallresults[index],
+            "success": self.toolcallsuccesses[index]
+        }
+
+    @property
+    def toolcalls(self) -> list[dict[str, t.Any]]:
+        """Tool calls as dicts, built on access."""
+        return [self._toolcall(i) for i in range(len(self.toolcallnames))]
 
     def previoustoolcall(self, name: t.Optional[str] = None) -> t.Optional[dict]:
-        if not self.toolcalls:
+        if not self.toolcallnames:
             return None
         if name is None:
-            return self.toolcalls[-1]
-        for call in reversed(self.toolcalls):
-            if call["name"] == name:
-                return call
+            return self._toolcall(-1)
+        names = self.toolcallnames
+        for i in range(len(names) - 1, -1, -1):
+            if names[i] == name:
+                return self._toolcall(i)
         return None
 
 
@@ -67,9 +98,9 @@ class DialogMemory:
             return None
         return self.validationresults[-1]
 
-@dataclass
+@dataclass(slots=True)
 class DialogHistory:
-    exchanges: list[dict[str, t.Any]] = field(default_factory=list)
+    exchanges: deque[dict[str, t.Any]] = field(default_factory=deque)
 
     def addexchange(self, role: str, content: str, metadata: t.Optional[dict]=None) -> None:
         self.exchanges.append({
@@ -88,26 +119,35 @@ class DialogHistory:
                 return exchange
         return None
 
+    def iterexchanges(self, count: int = 5) -> t.Iterator[dict]:
+        """Iterate the last count exchanges, newest first, without copying."""
+        return itertools.islice(reversed(self.exchanges), count)
+
     def listexchanges(self, count: int = 5) -> list[dict]:
         # probably add role filtration too
-        return (self.exchanges[-count:] if len(self.exchanges) >= count else self.exchanges.copy())
+        if 0 < count < len(self.exchanges):
+            return list(self.iterexchanges(count))[::-1]
+        return list(self.exchanges)[-count:] # as a list slice, so count <= 0 keeps its old meaning
 
     def clear(self) -> None:
         self.exchanges.clear()
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogState:
     stage: DialogStage = DialogStage.INITIALIZATION
     memory: DialogMemory = field(default_factory=DialogMemory)
     history: DialogHistory = field(default_factory=DialogHistory)
     error: t.Optional[tuple[ErrorType, Exception]] = None  # Now stores the exception object directly
     context: dict[str, t.Any] = field(default_factory=dict)
+    _manager: t.Optional[StateManager] = field(default=None, init=False, repr=False, compare=False)  # set by management.initialize
 
     def transitionto(self, newstage: DialogStage) -> None:
+        if self._manager is not None:
+            self._manager.handlestatetransition(newstage)
         oldstage = self.stage
         self.stage = newstage
-        log.info(f"Dialog state transition: {oldstage.name} -> {newstage.name}")
+        log.info("Dialog state transition: {} -> {}", oldstage.name, newstage.name)
 
     def seterror(self, exception: Exception) -> None:
         """Set the error state using an exception object directly"""
@@ -158,30 +198,34 @@ class DialogState:
         Returns:
             The detected error type
         """
+        exctype = type(exception)
+        if (errortype := ERRORTYPES.get(exctype)) is None:
+            errortype = ERRORTYPES[exctype] = cls._classifyexceptiontype(exctype)
+        return errortype
+
+    @classmethod
+    def _classifyexceptiontype(cls, exctype: type) -> ErrorType:
+        """Classify an exception type, by its hierarchy and then by naming convention."""
         # Import-related errors
-        if isinstance(exception, ImportError) or isinstance(exception, ModuleNotFoundError):
+        if issubclass(exctype, ImportError): # covers ModuleNotFoundError
             return ErrorType.IMPORTERROR
 
         # Syntax errors
-        if isinstance(exception, SyntaxError):
+        if issubclass(exctype, SyntaxError):
             return ErrorType.SYNTAXERROR
 
         # Type errors
-        if isinstance(exception, TypeError):
+        if issubclass(exctype, TypeError):
             return ErrorType.TYPEERROR
 
         # Check for custom framework errors
-        if (excname:=type(exception).__name__).endswith('ValidationError') or (excname == 'ValidationException'):
-            return ErrorType.VALIDATIONFAILED
-
-        if (excname.endswith('FrameworkError')) or (excname == 'FrameworkException'):
-            return ErrorType.FRAMEWORKINCOMPATIBLE
-
-        if (excname.endswith('PropositionError')) or (excname == 'PropositionException'):
-            return ErrorType.PROPOSITIONINVALID
+        excname = exctype.__name__
+        for suffix, exceptionname, errortype in NAMEDERRORTYPES:
+            if excname.endswith(suffix) or (excname == exceptionname):
+                return errortype
 
         # Execution errors
-        if isinstance(exception, (NameError, AttributeError, ValueError, IndexError, KeyError)):
+        if issubclass(exctype, (NameError, AttributeError, ValueError, IndexError, KeyError)):
             return ErrorType.EXECUTIONERROR
 
         # Default to unknown error
@@ -9,6 +9,94 @@ from formalities.utils.dialog.patterns.errors import ErrorContextProvider, Error
 from formalities.utils.discovery import frameworkregistry
 from loguru import logger as log
 
+# Handlers for error types with specialized handling, by method name so subclasses can override them
+ERRORHANDLERS: dict[ErrorType, str] = {
+    ErrorType.IMPORTERROR: '_handleimporterror',
+    ErrorType.TYPEERROR: '_handletypeerror',
+    ErrorType.SYNTAXERROR: '_handlesyntaxerror',
+    ErrorType.FRAMEWORKINCOMPATIBLE: '_handleframeworkerror',
+    ErrorType.PROPOSITIONINVALID: '_handlepropositionerror',
+}
+
+# Likely causes of syntax errors, by what their messages mention, checked in order
+SYNTAXHINTS: tuple[tuple[str, str], ...] = (
+    ("unexpected indent", "Inconsistent indentation (check spaces vs tabs)"),
+    ("unexpected eof", "Missing closing parenthesis, bracket, or quote"),
+    ("invalid syntax", "General syntax issue (missing comma, colon, etc.)"),
+)
+
+# Response templates for each handler; optional sections are rendered by section() and are empty when absent
+IMPORTTEMPLATE = """I noticed you're trying to import a component that isn't available: {message}
+
+Here are some components that might be relevant:
+{components}
+
+To explore available components, you could:
+1. Use the matchmaker tool to discover components
+2. Check formalities.core.types.propositions for available proposition types
+3. Check formalities.core.types.operators for logical operators
+
+Error details:
+- Type: {exceptiontype}
+- Message: {message}"""
+
+TYPETEMPLATE = """I noticed a type mismatch: {message}
+
+This usually means the object you're using doesn't match the expected interface.{types}{components}
+
+Consider:
+1. Checking the method signatures and required parameters
+2. Validating object types before passing them to functions
+3. Using appropriate type conversion where needed"""
+
+SYNTAXTEMPLATE = """I found a syntax error: {message}
+
+This often happens due to:
+- {cause}{location}
+
+Try:
+1. Checking indentation and line endings
+2. Ensuring all brackets and quotes are properly closed
+3. Verifying that all statements end with proper punctuation"""
+
+FRAMEWORKTEMPLATE = """I found a framework compatibility issue: {message}
+
+This occurs when a proposition or operation isn't supported by the chosen framework.{frameworks}{validationcontext}
+
+Consider:
+1. Using a different logical framework
+2. Adapting your proposition to fit framework constraints
+3. Creating a composite framework to handle mixed operations"""
+
+PROPOSITIONTEMPLATE = """I found an issue with the proposition: {message}
+
+This typically happens when a proposition doesn't meet validation criteria.{proptypes}{validationcontext}
+
+Consider:
+1. Checking the proposition structure
+2. Verifying all components are properly validated
+3. Using appropriate proposition types for your data"""
+
+GENERICTEMPLATE = """I encountered an error: {message}
+
+Error type: {exceptiontype}{suggestions}{components}
+
+I can help you troubleshoot this issue. Would you like to:
+1. Explore available components with the matchmaker tool
+2. Try a different approach
+3. Get more detailed information about specific components"""
+
+
+def section(header: str, lines: t.Iterable[str]) -> str:
+    """A headed block of lines to drop into a template, or nothing if there are no lines."""
+    body = "\n".join(lines)
+    return f"\n\n{header}\n{body}" if body else ""
+
+
+def validationsection(errorcontext: ErrorContext) -> str:
+    """The validation context of an error as a template section."""
+    return section("Validation context:", (f"- {key}: {value}" for key, value in (errorcontext.validationcontext or {}).items()))
+
 
 class ErrorCorrectionStrategy(DialogStrategy):
     """
@@ -45,260 +133,115 @@ class ErrorCorrectionStrategy(DialogStrategy):
             )
 
         # Dispatch to specialized handler based on error type
-        if errortype == ErrorType.IMPORTERROR:
-            return self._handleimporterror(state, errorcontext)
-        elif errortype == ErrorType.TYPEERROR:
-            return self._handletypeerror(state, errorcontext)
-        elif errortype == ErrorType.SYNTAXERROR:
-            return self._handlesyntaxerror(state, errorcontext)
-        elif errortype == ErrorType.FRAMEWORKINCOMPATIBLE:
-            return self._handleframeworkerror(state, errorcontext)
-        elif errortype == ErrorType.PROPOSITIONINVALID:
-            return self._handlepropositionerror(state, errorcontext)
-        else:
-            return self._handlegenericerror(state, errorcontext)
+        return getattr(self, ERRORHANDLERS.get(errortype, '_handlegenericerror'))(state, errorcontext)
 
     def _handleimporterror(self, state: DialogState, errorcontext: ErrorContext) -> DialogResponse:
         """Handle import errors by providing information about available components"""
-        message = [
-            f"I noticed you're trying to import a component that isn't available: {errorcontext.message}",
-            "",
-            "Here are some components that might be relevant:"
-        ]
-
-        # Add suggested components
-        if errorcontext.relatedcomponents:
-            for comp in errorcontext.relatedcomponents:
-                message.append(f"- {comp.name} ({comp.typeof}): Import from {comp.modulepath}")
-        else:
-            message.append("- No directly relevant components found.")
-
-        # Add general suggestions
-        message.extend([
-            "",
-            "To explore available components, you could:",
-            "1. Use the matchmaker tool to discover components",
-            "2. Check formalities.core.types.propositions for available proposition types",
-            "3. Check formalities.core.types.operators for logical operators"
-        ])
-
-        # Add error context
-        message.extend([
-            "",
-            "Error details:",
-            f"- Type: {errorcontext.exceptiontype}",
-            f"- Message: {errorcontext.message}"
-        ])
+        components = "\n".join(
+            f"- {comp.name} ({comp.typeof}): Import from {comp.modulepath}" for comp in (errorcontext.relatedcomponents or ())
+        ) or "- No directly relevant components found."
 
         return DialogResponse(
-            content="\n".join(message),
+            content=IMPORTTEMPLATE.format_map({
+                "message": errorcontext.message,
+                "components": components,
+                "exceptiontype": errorcontext.exceptiontype
+            }),
             action=DialogAction.RETRY,
             suggestedtools=["matchmaker"]
         )
 
     def _handletypeerror(self, state: DialogState, errorcontext: ErrorContext) -> DialogResponse:
         """Handle type errors by providing interface information"""
-        message = [
-            f"I noticed a type mismatch: {errorcontext.message}",
-            "",
-            "This usually means the object you're using doesn't match the expected interface."
-        ]
-
         # Extract specific type information if available
         typeanalysis = ErrorContextProvider.geterroranalysis(state.error[1], state.error[0])
+        types = ""
         if "providedtype" in typeanalysis and "expectedtype" in typeanalysis:
-            message.extend([
-                "",
-                f"Provided type: {typeanalysis['providedtype']}",
-                f"Expected type: {typeanalysis['expectedtype']}"
-            ])
-
-        # Add component suggestions
-        if errorcontext.relatedcomponents:
-            message.append("")
-            message.append("Here are components that might be compatible:")
-            for comp in errorcontext.relatedcomponents:
-                message.append(f"- {comp.name}: {comp.description.split('.')[0]}")
-
-        # General advice
-        message.extend([
-            "",
-            "Consider:",
-            "1. Checking the method signatures and required parameters",
-            "2. Validating object types before passing them to functions",
-            "3. Using appropriate type conversion where needed"
-        ])
+            types = f"\n\nProvided type: {typeanalysis['providedtype']}\nExpected type: {typeanalysis['expectedtype']}"
 
         return DialogResponse(
-            content="\n".join(message),
+            content=TYPETEMPLATE.format_map({
+                "message": errorcontext.message,
+                "types": types,
+                "components": section(
+                    "Here are components that might be compatible:",
+                    (f"- {comp.name}: {comp.description.split('.')[0]}" for comp in (errorcontext.relatedcomponents or ()))
+                )
+            }),
             action=DialogAction.RETRY,
             suggestedtools=["matchmaker"]
         )
 
     def _handlesyntaxerror(self, state: DialogState, errorcontext: ErrorContext) -> DialogResponse:
         """Handle syntax errors in user code"""
-        message = [
-            f"I found a syntax error: {errorcontext.message}",
-            "",
-            "This often happens due to:"
-        ]
-
         # Look for specific syntax patterns
         errorstr = errorcontext.message.lower()
-        if "unexpected indent" in errorstr:
-            message.append("- Inconsistent indentation (check spaces vs tabs)")
-        elif "unexpected eof" in errorstr:
-            message.append("- Missing closing parenthesis, bracket, or quote")
-        elif "invalid syntax" in errorstr:
-            message.append("- General syntax issue (missing comma, colon, etc.)")
-        else:
-            message.append("- General syntax issue")
+        cause = next((hint for marker, hint in SYNTAXHINTS if marker in errorstr), "General syntax issue")
 
         # Add context from the error
+        location = ""
         if errorcontext.traceback:
             lines = errorcontext.traceback.split("\n")
-            for line in lines:
+            for index, line in enumerate(lines):
                 if "^" in line:  # The pointer to error location
-                    index = lines.index(line)
                     if index > 0:
-                        message.extend([
-                            "",
-                            "The error appears to be here:",
-                            f"```python",
-                            lines[index-1],  # Code line
-                            line,            # Pointer
-                            f"```"
-                        ])
+                        location = f"\n\nThe error appears to be here:\n```python\n{lines[index-1]}\n{line}\n```"
                     break
 
-        # General advice
-        message.extend([
-            "",
-            "Try:",
-            "1. Checking indentation and line endings",
-            "2. Ensuring all brackets and quotes are properly closed",
-            "3. Verifying that all statements end with proper punctuation"
-        ])
-
         return DialogResponse(
-            content="\n".join(message),
+            content=SYNTAXTEMPLATE.format_map({
+                "message": errorcontext.message,
+                "cause": cause,
+                "location": location
+            }),
             action=DialogAction.RETRY
         )
 
     def _handleframeworkerror(self, state: DialogState, errorcontext: ErrorContext) -> DialogResponse:
         """Handle framework incompatibility errors"""
-        message = [
-            f"I found a framework compatibility issue: {errorcontext.message}",
-            "",
-            "This occurs when a proposition or operation isn't supported by the chosen framework."
-        ]
-
-        # Add framework suggestions
-        if errorcontext.relatedcomponents:
-            frameworks = [c for c in errorcontext.relatedcomponents if c.typeof == "framework"]
-            if frameworks:
-                message.append("")
-                message.append("Here are alternative frameworks that might support your needs:")
-                for fw in frameworks:
-                    message.append(f"- {fw.name}: {fw.description.split('.')[0]}")
-
-        # Add validation context
-        if errorcontext.validationcontext:
-            message.append("")
-            message.append("Validation context:")
-            for key, value in errorcontext.validationcontext.items():
-                message.append(f"- {key}: {value}")
-
-        # General suggestions
-        message.extend([
-            "",
-            "Consider:",
-            "1. Using a different logical framework",
-            "2. Adapting your proposition to fit framework constraints",
-            "3. Creating a composite framework to handle mixed operations"
-        ])
-
         return DialogResponse(
-            content="\n".join(message),
+            content=FRAMEWORKTEMPLATE.format_map({
+                "message": errorcontext.message,
+                "frameworks": section(
+                    "Here are alternative frameworks that might support your needs:",
+                    (f"- {fw.name}: {fw.description.split('.')[0]}" for fw in (errorcontext.relatedcomponents or ()) if fw.typeof == "framework")
+                ),
+                "validationcontext": validationsection(errorcontext)
+            }),
             action=DialogAction.RETRY,
             suggestedtools=["matchmaker"]
         )
 
     def _handlepropositionerror(self, state: DialogState, errorcontext: ErrorContext) -> DialogResponse:
         """Handle errors related to invalid propositions"""
-        message = [
-            f"I found an issue with the proposition: {errorcontext.message}",
-            "",
-            "This typically happens when a proposition doesn't meet validation criteria."
-        ]
-
-        # Add proposition type suggestions
-        proptypes = []
-        for comp in errorcontext.relatedcomponents:
-            if "Proposition" in comp.name:
-                proptypes.append(comp)
-
-        if proptypes:
-            message.append("")
-            message.append("Here are proposition types that might be appropriate:")
-            for prop in proptypes:
-                message.append(f"- {prop.name}: {prop.description.split('.')[0]}")
-
-        # Add validation context
-        if errorcontext.validationcontext:
-            message.append("")
-            message.append("Validation context:")
-            for key, value in errorcontext.validationcontext.items():
-                message.append(f"- {key}: {value}")
-
-        # General advice
-        message.extend([
-            "",
-            "Consider:",
-            "1. Checking the proposition structure",
-            "2. Verifying all components are properly validated",
-            "3. Using appropriate proposition types for your data"
-        ])
-
         return DialogResponse(
-            content="\n".join(message),
+            content=PROPOSITIONTEMPLATE.format_map({
+                "message": errorcontext.message,
+                "proptypes": section(
+                    "Here are proposition types that might be appropriate:",
+                    (f"- {prop.name}: {prop.description.split('.')[0]}" for prop in (errorcontext.relatedcomponents or ()) if "Proposition" in prop.name)
+                ),
+                "validationcontext": validationsection(errorcontext)
+            }),
             action=DialogAction.RETRY,
             suggestedtools=["matchmaker"]
         )
 
     def _handlegenericerror(self, state: DialogState, errorcontext: ErrorContext) -> DialogResponse:
         """Handle general errors when specific handlers aren't available"""
-        message = [
-            f"I encountered an error: {errorcontext.message}",
-            "",
-            f"Error type: {errorcontext.exceptiontype}"
-        ]
-
-        # Add suggestions from error context
-        if errorcontext.suggestions:
-            message.append("")
-            message.append("Here are some suggestions:")
-            for suggestion in errorcontext.suggestions:
-                message.append(f"- {suggestion}")
-
-        # Add related components
-        if errorcontext.relatedcomponents:
-            message.append("")
-            message.append("Related components that might be helpful:")
-            for comp in errorcontext.relatedcomponents:
-                message.append(f"- {comp.name} ({comp.typeof})")
-
-        # General guidance
-        message.extend([
-            "",
-            "I can help you troubleshoot this issue. Would you like to:",
-            "1. Explore available components with the matchmaker tool",
-            "2. Try a different approach",
-            "3. Get more detailed information about specific components"
-        ])
-
         return DialogResponse(
-            content="\n".join(message),
+            content=GENERICTEMPLATE.format_map({
+                "message": errorcontext.message,
+                "exceptiontype": errorcontext.exceptiontype,
+                "suggestions": section(
+                    "Here are some suggestions:",
+                    (f"- {suggestion}" for suggestion in (errorcontext.suggestions or ()))
+                ),
+                "components": section(
+                    "Related components that might be helpful:",
+                    (f"- {comp.name} ({comp.typeof})" for comp in (errorcontext.relatedcomponents or ()))
+                )
+            }),
             action=DialogAction.RETRY,
             suggestedtools=["matchmaker"]
         )
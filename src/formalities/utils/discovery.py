@@ -1,7 +1,8 @@
 # ~/formalities/src/formalities/utils/discovery.py
 from __future__ import annotations
-import inspect, importlib, typing as t
+import inspect, importlib, threading, typing as t
 from pathlib import Path
+from collections import defaultdict
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from formalities.frameworks.base import Framework
@@ -28,11 +29,26 @@ class FrameworkRegistry:
     def __init__(self):
         self._components: dict[str, ComponentInfo] = {}
         self._frameworkpath = Path(__file__).parent.parent
+        self._keywordmatches: dict[str, tuple[ComponentInfo, ...]] = {} # cleared whenever a component registers
+        self._generation = 0 # bumped whenever a component registers
+        self._classes: dict[str, t.Type] = {} # resolved component classes, by name
+        # names of components registered under each type and base class, in registration order; query re-checks
+        # what it finds through them, so a name left behind by re-registering under another type is skipped
+        self._typeindex: dict[str, dict[str, None]] = defaultdict(dict)
+        self._baseindex: dict[str, dict[str, None]] = defaultdict(dict)
+        # discovery runs on first use rather than at import; the lock is reentrant since scanning imports
+        # modules that may query the registry themselves, which then see the components found so far
+        self._discovered = False
+        self._discovering = False
+        self._discoverylock = threading.RLock()
 
 
     def _registercomp(self, name: str, cls: t.Type, comptype: str, modulepath: str) -> None:
         """Register a component with its metadata"""
-        self._components[name] = ComponentInfo(
+        self._keywordmatches.clear()
+        self._generation += 1
+        self._classes[name] = cls # already in hand, so getcomp needn't import it again
+        self._components[name] = info = ComponentInfo(
             name=name,
             typeof=comptype,
             description=(cls.__doc__ or ""),
@@ -40,6 +56,9 @@ class FrameworkRegistry:
             classname=cls.__name__,
             baseclasses=[base.__name__ for base in cls.__bases__]
         )
+        self._typeindex[comptype][name] = None
+        for base in info.baseclasses:
+            self._baseindex[base][name] = None
 
     def _conditionalregister(self, name: str, obj: t.Any, modulepath: str) -> None:
         typeof = None
@@ -60,8 +79,9 @@ class FrameworkRegistry:
             modulepath = str(item.relative_to(self._frameworkpath.parent)).replace("/", ".").replace(".py", "")
             try:
                 module = importlib.import_module(modulepath)
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isclass(obj):
+                # only classes defined here, re-exports are registered from the module defining them
+                for name, obj in vars(module).items():
+                    if inspect.isclass(obj) and (obj.__module__ == module.__name__):
                         self._conditionalregister(name, obj, modulepath)
             except ImportError as e:
                 log.error(f"FrameworkRegistry._scandir | failed to import {modulepath} | {str(e)}")
@@ -70,17 +90,54 @@ class FrameworkRegistry:
     def discoverall(self) -> None:
         self._scandir(self._frameworkpath)
 
+    def ensurediscovered(self) -> None:
+        """Discover all components, once, before the registry is first read."""
+        if self._discovered:
+            return
+        with self._discoverylock:
+            if self._discovered or self._discovering:
+                return
+            self._discovering = True
+            try:
+                self.discoverall()
+            finally:
+                self._discovering = False
+            self._discovered = True
+
+
+    @property
+    def generation(self) -> int:
+        """Changes whenever a component registers, for keying caches built from queries."""
+        self.ensurediscovered()
+        return self._generation
+
+    def __len__(self) -> int:
+        self.ensurediscovered()
+        return len(self._components)
 
     def getcomp(self, name: str) -> t.Optional[t.Type]:
+        self.ensurediscovered()
+        if (cls := self._classes.get(name)) is not None:
+            return cls
         if name not in self._components:
             return None
         info = self._components[name]
         module = importlib.import_module(info.modulepath)
-        return getattr(module, info.classname)
+        cls = self._classes[name] = getattr(module, info.classname)
+        return cls
 
     def query(self, comptype: t.Optional[str] = None, baseclass: t.Optional[str] = None, keyword: t.Optional[str] = None) -> list[ComponentInfo]:
+        self.ensurediscovered()
+        # only look through the components indexed under the type or base class asked for, whichever is fewer
+        buckets = [self._typeindex.get(comptype, {})] if comptype else []
+        if baseclass:
+            buckets.append(self._baseindex.get(baseclass, {}))
+        if buckets:
+            candidates = (info for name in min(buckets, key=len) if (info := self._components.get(name)) is not None)
+        else:
+            candidates = self._components.values()
         results = []
-        for info in self._components.values():
+        for info in candidates:
             matches = True
             if comptype and info.typeof != comptype:
                 matches = False
@@ -92,6 +149,12 @@ class FrameworkRegistry:
                 results.append(info)
         return results
 
+    def querykeyword(self, keyword: str) -> tuple[ComponentInfo, ...]:
+        """Components whose description mentions keyword, memoized until the next registration."""
+        self.ensurediscovered()
+        if (matches := self._keywordmatches.get(keyword)) is None:
+            matches = self._keywordmatches[keyword] = tuple(self.query(keyword=keyword))
+        return matches
+
 
 frameworkregistry = FrameworkRegistry()
-frameworkregistry.discoverall()
@@ -24,11 +24,60 @@ class FrameworkSuggestion:
     notes: list[str] = field(default_factory=list)
 
 
+# Framework attributes listing what it supports, in the order capabilities returns them
+CAPABILITYATTRIBUTES = ('features', 'supported_operators', 'supported_types')
+
+
+def classlevel(framework: Framework, name: str) -> bool:
+    """Whether a framework's attribute comes straight from its class, so every instance of the class shares it."""
+    if name in getattr(framework, '__dict__', {}):
+        return False
+    # properties, slots and other descriptors can differ per instance
+    return not hasattr(type(getattr(type(framework), name, None)), '__get__')
+
+
+def membership(values: t.Any) -> t.Container:
+    """
+    Values as a container for `in` checks meaning the same as on the values themselves:
+    list-likes of hashables become frozensets, anything else (a string, tested by substring) is kept as is.
+    """
+    if isinstance(values, (list, tuple, set, frozenset)):
+        try:
+            return frozenset(values)
+        except TypeError:
+            return values
+    return values
+
+
 class FrameworkSelector:
     """Handles framework selection and compatibility checking"""
 
     def __init__(self):
         self._registry = frameworkregistry
+        self._capabilities: dict[type, tuple[t.Container, t.Container, t.Container]] = {} # by framework class
+        self._conflicts: dict[type, t.Container] = {} # by framework class
+
+    def capabilities(self, framework: Framework) -> tuple[t.Container, t.Container, t.Container]:
+        """
+        The features, operators and logic types a framework supports, for membership checks.
+        Gathered once per framework class when all three are class attributes, read from the instance otherwise.
+        """
+        if not all(classlevel(framework, name) for name in CAPABILITYATTRIBUTES):
+            return tuple(membership(getattr(framework, name, ())) for name in CAPABILITYATTRIBUTES)
+        if (capabilities := self._capabilities.get(fwtype := type(framework))) is None:
+            capabilities = self._capabilities[fwtype] = tuple(membership(getattr(framework, name, ())) for name in CAPABILITYATTRIBUTES)
+        return capabilities
+
+    def conflicts(self, framework: Framework) -> t.Container:
+        """
+        What a framework conflicts with, as a container of class names for membership checks.
+        Gathered once per framework class when `conflicts_with` is a class attribute, read from the instance otherwise.
+        """
+        if not classlevel(framework, 'conflicts_with'):
+            return membership(getattr(framework, 'conflicts_with', ()))
+        if (conflicts := self._conflicts.get(fwtype := type(framework))) is None:
+            conflicts = self._conflicts[fwtype] = membership(getattr(framework, 'conflicts_with', ()))
+        return conflicts
 
     def checkcompatibility(self, proposition: Proposition, framework: Framework) -> ValidationResult:
         """
@@ -75,18 +124,29 @@ class FrameworkSelector:
         """
         errors = []
 
-        # Check each framework's compatibility
+        # Check each framework's compatibility, once per framework however often it's listed
+        results: dict[int, ValidationResult] = {}
         for fw in frameworks:
-            result = self.checkcompatibility(proposition, fw)
+            if (result := results.get(id(fw))) is None:
+                result = results[id(fw)] = self.checkcompatibility(proposition, fw)
             if not result.isvalid:
                 errors.extend(result.errors)
 
-        # Check for framework conflicts
-        for i, fw1 in enumerate(frameworks):
-            for fw2 in frameworks[i+1:]:
-                # Basic conflict check - could be enhanced
-                if hasattr(fw1, 'conflicts_with') and fw2.__class__.__name__ in fw1.conflicts_with:
-                    errors.append(f"Framework conflict: {fw1.name} incompatible with {fw2.name}")
+        # Check for framework conflicts in one pass, each framework meeting the earlier ones that conflict with it
+        declared: dict[str, list[int]] = {} # class name -> positions of frameworks conflicting with it
+        opaque: list[tuple[int, t.Container]] = [] # conflicts that only answer `in`, e.g. a string
+        conflicting: list[tuple[int, int]] = []
+        for j, fw in enumerate(frameworks):
+            name = fw.__class__.__name__
+            conflicting.extend((i, j) for i in declared.get(name, ()))
+            conflicting.extend((i, j) for i, conflicts in opaque if name in conflicts)
+            if isinstance(conflicts := self.conflicts(fw), frozenset):
+                for conflict in conflicts:
+                    declared.setdefault(conflict, []).append(j)
+            else:
+                opaque.append((j, conflicts))
+        for i, j in sorted(conflicting): # reported in pair order
+            errors.append(f"Framework conflict: {frameworks[i].name} incompatible with {frameworks[j].name}")
 
         return ValidationResult(
             (len(errors) == 0),
@@ -122,29 +182,23 @@ class FrameworkSelector:
 
                 framework = fwclass()
                 compatibility = 1.0
-                missing = []
                 notes = []
 
+                fwfeatures, fwoperators, fwtypes = self.capabilities(framework)
+
                 # Check features
-                fwfeatures = getattr(framework, 'features', [])
-                for feat in requirements.features:
-                    if feat not in fwfeatures:
-                        compatibility *= 0.8
-                        missing.append(feat)
+                missing = [feat for feat in requirements.features if feat not in fwfeatures]
+                compatibility *= 0.8 ** len(missing)
 
                 # Check operator support
-                fwoperators = getattr(framework, 'supported_operators', [])
-                for op in requirements.operators:
-                    if op not in fwoperators:
-                        compatibility *= 0.9
-                        notes.append(f"Missing operator support: {op}")
+                unsupported = [op for op in requirements.operators if op not in fwoperators]
+                compatibility *= 0.9 ** len(unsupported)
+                notes.extend(f"Missing operator support: {op}" for op in unsupported)
 
                 # Check type support
-                fwtypes = getattr(framework, 'supported_types', [])
-                for lt in requirements.logictypes:
-                    if lt not in fwtypes:
-                        compatibility *= 0.7
-                        notes.append(f"Missing type support: {lt}")
+                unsupported = [lt for lt in requirements.logictypes if lt not in fwtypes]
+                compatibility *= 0.7 ** len(unsupported)
+                notes.extend(f"Missing type support: {lt}" for lt in unsupported)
 
                 # Check proposition compatibility if provided
                 if proposition:
@@ -1,7 +1,7 @@
 # ~/formalities/src/formalities/utils/integrations.py
 from __future__ import annotations
 import typing as t
-from formalities.utils.dialog.controller import dialogcontroller, DialogRequest, DialogResponse, DialogAction
+from formalities.utils.dialog.controller import dialogcontroller, TOOLDISPATCH, DialogRequest, DialogResponse, DialogAction
 from formalities.utils.dialog.strategies.correction import RecoverableErrorHandler
 from formalities.utils.toolcalls import toolcallhandler, ToolCallRequest, ToolCallResponse
 from formalities.frameworks.base import ValidationResult
@@ -29,13 +29,9 @@ def integratetoolhandler() -> None:
     def enhancedhandletoolcall(name: str, args: dict) -> t.Any:
         """Enhanced handletoolcall that routes to the appropriate handler"""
         try:
-            response = None
-            if name == "matchmaker":
-                response = toolcallhandler._matchmaker(args)
-            elif name == "methodbuilder":
-                response = toolcallhandler._methodbuilder(args)
-            else:
+            if (handler := TOOLDISPATCH.get(name)) is None:
                 raise ValueError(f"Unknown tool: {name}")
+            response = handler(args)
 
             rdata = response.data if response.success else {"error": response.error}
             dialogcontroller.state.memory.addtoolcall(name, args, rdata, response.success)
@@ -125,11 +121,9 @@ def integratestatemanagement() -> None:
     from formalities.utils.dialog.management import initialize
 
     # Check if we already initialized
-    if hasattr(dialogcontroller.state, 'transitionto'):
-        originalfunction = dialogcontroller.state.transitionto.__name__
-        if originalfunction == 'enhancedtransition':
-            log.info("State management already initialized, skipping")
-            return
+    if dialogcontroller.state._manager is not None:
+        log.info("State management already initialized, skipping")
+        return
 
     initialize(dialogcontroller.state)
     #log.info("Integrated state management with dialog controller")
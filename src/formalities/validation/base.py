@@ -1,6 +1,6 @@
 # ~/formalities/src/formalities/validation/base.py
 from __future__ import annotations
-import typing as t
+import time, typing as t
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from dataclasses import dataclass, field
@@ -55,7 +55,7 @@ class ValidationContext:
             "proposition": str(proposition),
             "success": success,
             "errors": errors or [],
-            "timestamp": "current_time()"  # TODO: Add proper timestamp
+            "timestamp": time.monotonic_ns()
         })
 
     def createchild(self) -> ValidationContext:
@@ -0,0 +1,15 @@
+# ~/formalities/tests/core/types/test_atomic_propositions.py
+import pytest
+from formalities.core.types.propositions.atomic import AtomicProposition
+
+def test_equal_atoms_keep_their_own_state():
+    p = AtomicProposition("P")
+    object.__setattr__(p, '_truthvalue', True)
+    q = AtomicProposition("P")
+    assert q is not p
+    assert p.evaluate() is True
+    with pytest.raises(ValueError):
+        q.evaluate()
+    x = AtomicProposition("X", True)
+    AtomicProposition("X", 1)
+    assert x._truthvalue is True
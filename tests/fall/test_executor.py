@@ -0,0 +1,123 @@
+# ~/formalities/tests/fall/test_executor.py
+import pytest
+from formalities.fall.bridges.logic import LogicBridge
+from formalities.fall.parser.abstract import (
+    Proof, ProofStep, AxiomDefinition, Condition
+)
+from formalities.fall.runtime.executor import ProofExecutor, ProofContext
+
+@pytest.fixture
+def bridge():
+    bridge = LogicBridge()
+    bridge.createproposition("p", True)
+    bridge.createproposition("q", True)
+    bridge.createproposition("u")
+    bridge.createproposition("r")
+    return bridge
+
+@pytest.fixture
+def axioms():
+    return {"Syllogism": AxiomDefinition("Syllogism", [Condition("p IS true AND q IS true")])}
+
+def syllogism(*sources: str) -> Proof:
+    return Proof(
+        given=list(dict.fromkeys(["p", "q", *sources])),
+        prove="r",
+        using=["Syllogism"],
+        steps=[
+            ProofStep(1, "ASSERT", "p AND q"),
+            ProofStep(2, "INFER", "r", list(sources), "Syllogism"),
+        ]
+    )
+
+def test_proof_succeeds(bridge, axioms):
+    success, context = ProofExecutor(bridge).executeproof(syllogism("p", "q"), axioms)
+    assert success
+    assert "r" in context.derived
+    assert bridge.getprop("r").evaluate() is True
+
+def test_proof_fails_without_truth_value(bridge, axioms):
+    success, context = ProofExecutor(bridge).executeproof(syllogism("p", "u"), axioms)
+    assert not success
+    assert context.history[-1]["error"] == "Evaluation Error: No Truth Value for u"
+
+def test_history_entries(bridge, axioms):
+    success, context = ProofExecutor(bridge).executeproof(syllogism("p", "q"), axioms)
+    entries = list(context.entries())
+    assert [step for step, *_ in entries] == [1, 2, 3]
+    assert entries[-1] == (3, "CONCLUSION:r", True, None)
+    assert context.history[0]["result"] is True
+
+def test_evalctx_maintained_incrementally(bridge, axioms):
+    context = ProofContext(bridge)
+    context.addgiven("p", bridge.getprop("p"))
+    context.addgiven("u", bridge.getprop("u"))
+    assert context.evalctx == {"p": True}
+    success, context = ProofExecutor(bridge).executeproof(syllogism("p", "q"), axioms)
+    assert success
+    assert context.evalctx == {"p": True, "q": True, "r": True}
+
+def test_namespace_resolution_order(bridge):
+    context = ProofContext(bridge)
+    p, q, r = bridge.getprop("p"), bridge.getprop("q"), bridge.getprop("r")
+    context.addgiven("p", p)
+    context.addstep(1, q)
+    context.addderived("p", r)
+    context.addderived("step1", r)
+    context.addderived("r", r)
+    assert context.namespace == {"p": p, "step1": q, "r": r}
+
+def test_infer_from_step_alias(bridge, axioms):
+    proof = Proof(["p", "q"], "r", ["Syllogism"], [
+        ProofStep(1, "INFER", "s", ["p", "q"], "Syllogism"),
+        ProofStep(2, "INFER", "r", ["step1", "q"], "Syllogism"),
+    ])
+    success, context = ProofExecutor(bridge).executeproof(proof, axioms)
+    assert success
+    assert context.steps[2] is context.derived["r"]
+
+def test_infer_from_padded_step_alias(bridge, axioms):
+    proof = Proof(["p", "q"], "r", ["Syllogism"], [
+        ProofStep(1, "INFER", "s", ["p", "q"], "Syllogism"),
+        ProofStep(2, "INFER", "r", ["step01", "step 1"], "Syllogism"),
+    ])
+    success, context = ProofExecutor(bridge).executeproof(proof, axioms)
+    assert success
+    assert context.resolve("step01") is context.steps[1]
+
+def test_conclusion_matched_by_step_symbol(bridge, axioms):
+    proof = Proof(["p", "q"], "r", ["Syllogism"], [ProofStep(1, "ASSERT", "r")])
+    success, context = ProofExecutor(bridge).executeproof(proof, axioms)
+    assert success
+    assert context.symbolindex == {"r": bridge.getprop("r")}
+    assert context.compoundsteps == 0
+
+def test_atomic_premise_fast_path(bridge):
+    executor = ProofExecutor(bridge)
+    p, q, u = bridge.getprop("p"), bridge.getprop("q"), bridge.getprop("u")
+    assert executor._validateatomicpremises([p, q]).isvalid
+    assert executor._validateatomicpremises([q, p]).errors == ()
+    assert executor._validateatomicpremises([p, u]).errors == ["Evaluation Error: No Truth Value for u"]
+    assert executor._validateatomicpremises([p]) is None
+    assert executor._validateatomicpremises([p, bridge.parseexpression("p AND q")]) is None
+
+def test_axiom_preconditions_cached_until_props_change(bridge, axioms):
+    executor = ProofExecutor(bridge)
+    axiom = axioms["Syllogism"]
+    preconditions = executor.getaxiompreconditions(axiom)
+    assert len(preconditions) == 1
+    assert executor.getaxiompreconditions(axiom) is preconditions
+    bridge.createproposition("s", True)
+    assert executor.getaxiompreconditions(axiom) is not preconditions
+
+def test_parse_cache_invalidated_on_register(bridge):
+    first = bridge.parseexpression("p AND r")
+    assert bridge.parseexpression("p AND r") is first
+    bridge.registerprop("r", bridge.parseexpression("r IS true"))
+    assert bridge.parseexpression("p AND r").components[1]._truthvalue is True
+
+def test_proof_context_slotted(bridge):
+    context = ProofContext(bridge)
+    assert not hasattr(context, "__dict__")
+    with pytest.raises(AttributeError):
+        context.scratch = {}
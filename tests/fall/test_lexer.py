@@ -39,3 +39,22 @@ def test_basic_lexing():
 
     # Check if end of lines are recognized
     assert any(t.type == TokenType.EOL for t in tokens)
+
+def test_character_classes():
+    tokens = Lexer('_under9 café 42 3.5 $').scantokens()
+    types = [t.type for t in tokens]
+    assert types == [
+        TokenType.IDENTIFIER, TokenType.IDENTIFIER, TokenType.NUMBER,
+        TokenType.NUMBER, TokenType.ERROR, TokenType.EOF
+    ]
+    assert tokens[0].lexeme == "_under9"
+    assert tokens[1].lexeme == "café"
+    assert tokens[2].value == 42 and isinstance(tokens[2].value, int)
+    assert tokens[3].value == 3.5
+
+def test_token_columns():
+    tokens = Lexer('QUERY r //\nASSERT p').scantokens()
+    assert [(t.lexeme, t.line, t.column) for t in tokens[:-1]] == [
+        ("QUERY", 1, 1), ("r", 1, 7), ("//", 1, 9), ("\n", 2, 11),
+        ("ASSERT", 2, 0), ("p", 2, 7),
+    ]
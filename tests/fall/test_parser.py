@@ -0,0 +1,82 @@
+# ~/formalities/tests/fall/test_parser.py
+import pytest
+from formalities.fall.parser.lexing import Lexer
+from formalities.fall.parser.parsing import Parser
+from formalities.fall.parser.abstract import (
+    Visitor, Program, Query, Assertion, ProofStep, ASSERTSTEP, INFERSTEP, UNKNOWNSTEP
+)
+
+PROGRAM = """
+DEFINE AXIOM Syllogism WHERE p IS TRUE AND q IS TRUE //
+
+BEGIN PROOF
+GIVEN p
+GIVEN q
+PROVE r
+USING Syllogism
+STEP 1: ASSERT p AND q
+STEP 2: INFER r FROM [p, q] VIA Syllogism
+END PROOF //
+
+QUERY r //
+"""
+
+def parse(source: str) -> Program:
+    return Parser(Lexer(source).scantokens()).parse()
+
+class RecordingVisitor(Visitor):
+    def __init__(self):
+        self.visited = []
+
+    def visitruledef(self, node): self.visited.append('rule')
+    def visitaxiomdef(self, node): self.visited.append('axiom')
+    def visitpropdef(self, node): self.visited.append('prop')
+    def visitassertion(self, node): self.visited.append('assertion')
+    def visitproof(self, node): self.visited.append('proof')
+    def visitquery(self, node): self.visited.append('query')
+
+    def visitprogram(self, node):
+        for statement in node.statements:
+            self.dispatch(statement)
+
+def test_dispatch_table():
+    visitor = RecordingVisitor()
+    visitor.dispatch(parse(PROGRAM))
+    assert visitor.visited == ['axiom', 'proof', 'query']
+
+def test_accept_delegates_to_dispatch():
+    visitor = RecordingVisitor()
+    Query("r").accept(visitor)
+    assert visitor.visited == ['query']
+
+def test_dispatch_resolves_node_subclass():
+    class TaggedAssertion(Assertion):
+        pass
+
+    visitor = RecordingVisitor()
+    visitor.dispatch(TaggedAssertion("p AND q"))
+    assert visitor.visited == ['assertion']
+
+def test_nodes_are_slotted():
+    program = parse(PROGRAM)
+    assert not hasattr(program, '__dict__')
+    for statement in program.statements:
+        assert not hasattr(statement, '__dict__')
+
+def test_proofstep_action_and_expr():
+    proof = parse(PROGRAM).statements[1]
+    assert [(s.number, s.action, s.expr) for s in proof.steps] == [
+        (1, "ASSERT", "p AND q"),
+        (2, "INFER", "r"),
+    ]
+    assert proof.steps[1].source == ["p", "q"]
+    assert proof.steps[1].via == "Syllogism"
+
+def test_proofstep_kind():
+    proof = parse(PROGRAM).statements[1]
+    assert [s.kind for s in proof.steps] == [ASSERTSTEP, INFERSTEP]
+    assert ProofStep(3, "DERIVE", "r").kind == UNKNOWNSTEP
+
+def test_error_recovery_resumes_at_next_statement():
+    program = parse("FOO BAR QUERY p //\nQUERY q //\n")
+    assert [s.proposition for s in program.statements] == ["p", "q"]
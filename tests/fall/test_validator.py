@@ -0,0 +1,35 @@
+# ~/formalities/tests/fall/test_validator.py
+import pytest
+from formalities.fall.runtime.validator import FallValidator
+from formalities.fall.parser.abstract import AxiomDefinition, Condition, PropositionDefinition
+
+@pytest.fixture
+def validator():
+    return FallValidator()
+
+def test_axiom_condition_errors_reused(validator):
+    axiom = AxiomDefinition("ModusPonens", [Condition("p IMPLIES q")])
+    assert validator.validateaxiom(axiom).isvalid
+    generation = validator.bridge.generation
+    assert validator.validateaxiom(axiom).isvalid
+    assert validator.bridge.generation == generation
+    assert len(validator._conditionerrors) == 1
+
+def test_axiom_condition_errors_dropped_on_bridge_change(validator):
+    axiom = AxiomDefinition("ModusPonens", [Condition("p IMPLIES q")])
+    validator.validateaxiom(axiom)
+    validator.bridge.createproposition("r")
+    validator.validateaxiom(AxiomDefinition("Other", [Condition("q IMPLIES p")]))
+    assert list(validator._conditionerrors) == [(("q IMPLIES p",), validator.bridge.framework)]
+
+def test_proposition_validation_still_registers(validator):
+    propdef = PropositionDefinition("p", "The sky is blue", {})
+    assert validator.validateproposition(propdef).isvalid
+    validator.bridge.registerprop("p", validator.bridge.parseexpression("q"))
+    assert validator.validateproposition(propdef).isvalid
+    assert validator.bridge.getprop("p").symbol == "p"
+
+def test_names_follow_identifier_rules(validator):
+    assert validator.validateproposition(PropositionDefinition("sky_blue", "The sky is blue", {})).isvalid
+    invalid = validator.validateproposition(PropositionDefinition("sky-blue", "The sky is blue", {}))
+    assert invalid.errors[0] == "Invalid proposition name: sky-blue"
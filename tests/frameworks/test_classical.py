@@ -0,0 +1,91 @@
+# ~/formalities/tests/frameworks/test_classical.py
+import pytest
+from formalities.core.types.propositions.atomic import AtomicProposition
+from formalities.core.types.propositions.compound import CompoundProposition
+from formalities.core.types.operators.boolean import AND, OR, NOT, XOR, IMPLIES
+
+@pytest.fixture
+def atoms():
+    return AtomicProposition("P"), AtomicProposition("Q")
+
+def test_compatibility_over_shared_subformulas(classical_framework, atoms):
+    p, q = atoms
+    shared = CompoundProposition(OR(), (p, q))
+    for _ in range(40):
+        shared = CompoundProposition(AND(), (shared, shared))
+    assert classical_framework.iscompatible(shared)
+    assert not classical_framework.iscompatible(CompoundProposition(AND(), (shared, CompoundProposition(XOR(), (p, q)))))
+
+def test_contradiction_detected(classical_framework, atoms):
+    p, q = atoms
+    contradiction = CompoundProposition(AND(), (p, CompoundProposition(NOT(), (p,))))
+    result = classical_framework.validate(CompoundProposition(OR(), (q, contradiction)))
+    assert not result.isvalid
+    assert len(result.errors) == 1
+    assert classical_framework.validate(CompoundProposition(AND(), (p, q))).isvalid
+
+def test_validate_over_shared_subformulas(classical_framework, atoms):
+    p, q = atoms
+    shared = CompoundProposition(AND(), (p, CompoundProposition(NOT(), (p,))))
+    for _ in range(40):
+        shared = CompoundProposition(OR(), (shared, shared))
+    result = classical_framework.validate(shared)
+    assert result.errors == ["Contradiction found: conjunction of P and ¬P"]
+
+def test_shared_valid_result_immutable(classical_framework, atoms):
+    p, _ = atoms
+    result = classical_framework.validate(p)
+    assert result.isvalid and result.errors == ()
+    with pytest.raises(AttributeError):
+        result.errors.append("corrupted")
+
+def test_deep_proposition_walk(classical_framework, atoms):
+    p, _ = atoms
+    deep = p
+    for _ in range(5000):
+        deep = CompoundProposition(NOT(), (deep,))
+    assert classical_framework.iscompatible(deep)
+    assert classical_framework.validate(deep).isvalid
+
+def test_propositions_slotted(sample_compound_prop):
+    assert not hasattr(sample_compound_prop, "__dict__")
+    assert not hasattr(sample_compound_prop.components[0], "__dict__")
+
+def test_compatibility_cached_per_instance(classical_framework, atoms, monkeypatch):
+    p, q = atoms
+    calls = []
+    original = classical_framework.iscompatible
+    monkeypatch.setattr(classical_framework, "iscompatible", lambda prop: calls.append(prop) or original(prop))
+    for value in (True, False):
+        assert classical_framework.evaluate(p, {"P": value}) is value
+    assert calls == [p]
+    with pytest.raises(ValueError):
+        classical_framework.evaluate(CompoundProposition(XOR(), (p, q)), {"P": True, "Q": True})
+
+def test_compatibility_cache_without_chained_init(atoms):
+    from formalities.frameworks.simple import ClassicalFramework
+    class Custom(ClassicalFramework):
+        def __init__(self):
+            self.label = "custom"
+    p, q = atoms
+    assert Custom().evaluate(p, {"P": True}) is True
+
+def test_evaluation_sees_changed_truth_values(classical_framework, atoms):
+    p, q = atoms
+    assert classical_framework.evaluate(p, {"P": True}) is True
+    object.__setattr__(p, '_truthvalue', False)
+    assert classical_framework.evaluate(p, {"P": True}) is False
+
+def test_compiled_truth_table(classical_framework, atoms):
+    p, q = atoms
+    shared = CompoundProposition(IMPLIES(), (p, q))
+    compiled = classical_framework.compile(CompoundProposition(AND(), (shared, CompoundProposition(NOT(), (shared,)))))
+    assert compiled.atoms == ("P", "Q")
+    assert compiled.evaluateall() == [False] * 4
+    compiled = classical_framework.compile(CompoundProposition(OR(), (CompoundProposition(NOT(), (p,)), q)))
+    assert compiled.evaluateall() == [True, False, True, True]
+    assert compiled.evaluate({"P": True, "Q": False}) is False
+    assert compiled.countsatisfying() == 3
+    assert compiled.issatisfiable() and not compiled.istautology()
+    with pytest.raises(ValueError):
+        classical_framework.compile(CompoundProposition(XOR(), (p, q)))
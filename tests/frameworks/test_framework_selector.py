@@ -33,3 +33,24 @@ def test_framework_suggestions():
     assert len(suggestions) > 0
     assert all(isinstance(s, FrameworkSuggestion) for s in suggestions)
     assert all(0 <= s.compatibility <= 1 for s in suggestions)
+
+def test_capabilities_read_per_instance_features():
+    from formalities.frameworks.simple import ClassicalFramework
+    selector = FrameworkSelector()
+    shared, custom = ClassicalFramework(), ClassicalFramework()
+    custom.features = ["modal"]
+
+    assert "modal" not in selector.capabilities(shared)[0]
+    assert "modal" in selector.capabilities(custom)[0]
+    assert "modal" not in selector.capabilities(shared)[0]
+
+def test_string_conflicts_keep_substring_membership():
+    from formalities.frameworks.simple import ClassicalFramework
+    selector = FrameworkSelector()
+    first, second = ClassicalFramework(), ClassicalFramework()
+    first.conflicts_with = "ClassicalFrameworkV2"
+    second.conflicts_with = "Cl"
+
+    result = selector.validateconstraints([first, second, ClassicalFramework()], AtomicProposition("P"))
+    assert len(result.errors) == 2
+    assert selector.validateconstraints([second, first], AtomicProposition("P")).isvalid
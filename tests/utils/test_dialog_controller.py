@@ -0,0 +1,61 @@
+# ~/formalities/tests/utils/test_dialog_controller.py
+import pytest
+from formalities.utils.dialog.controller import (
+    DialogController, DialogStrategy, DialogRequest, DialogResponse, DialogAction
+)
+from formalities.utils.dialog.state import DialogStage
+
+class StageStrategy(DialogStrategy):
+    def __init__(self, name, stages, fail=False, declines=False):
+        self._name, self._stages, self.fail, self.declines = name, stages, fail, declines
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def handleablestages(self):
+        return self._stages
+
+    def canhandle(self, state):
+        return (not self.declines) and super().canhandle(state)
+
+    def apply(self, state, request):
+        if self.fail:
+            raise RuntimeError("strategy failed")
+        return DialogResponse(content=self._name)
+
+def test_processrequest_uses_first_strategy_for_stage():
+    controller = DialogController()
+    controller.registerstrategy(StageStrategy("reasoning", [DialogStage.REASONING]))
+    controller.registerstrategy(StageStrategy("initial", [DialogStage.INITIALIZATION]))
+    controller.registerstrategy(StageStrategy("other", [DialogStage.INITIALIZATION]))
+    assert controller.processrequest(DialogRequest("hi")).content == "initial"
+    controller.state.transitionto(DialogStage.CONCLUSION)
+    assert controller.processrequest(DialogRequest("hi")).action == DialogAction.FALLBACK
+
+def test_processrequest_retries_with_error_strategy():
+    controller = DialogController()
+    controller.registerstrategy(StageStrategy("initial", [DialogStage.INITIALIZATION], fail=True))
+    controller.registerstrategy(StageStrategy("errors", [DialogStage.ERRORHANDLING]))
+    assert controller.processrequest(DialogRequest("hi")).content == "errors"
+
+def test_processrequest_skips_strategies_that_decline():
+    controller = DialogController()
+    controller.registerstrategy(StageStrategy("declining", [DialogStage.INITIALIZATION], declines=True))
+    controller.registerstrategy(StageStrategy("initial", [DialogStage.INITIALIZATION], fail=True))
+    controller.registerstrategy(StageStrategy("declining errors", [DialogStage.ERRORHANDLING], declines=True))
+    controller.registerstrategy(StageStrategy("errors", [DialogStage.ERRORHANDLING]))
+    assert controller.processrequest(DialogRequest("hi")).content == "errors"
+
+def test_toolcalls_recorded_in_memory(monkeypatch):
+    from formalities.utils.dialog import controller as module
+    from formalities.utils.toolcalls import ToolCallResponse
+    monkeypatch.setitem(module.TOOLDISPATCH, "echo", lambda args: ToolCallResponse(success=True, data=args))
+    controller = DialogController()
+    assert controller.handletoolcall("echo", {"x": 1}) == {"x": 1}
+    controller.handletoolcall("missing", {})
+    memory = controller.state.memory
+    assert [call["name"] for call in memory.toolcalls] == ["echo"]
+    assert memory.previoustoolcall("echo")["result"] == {"x": 1}
+    assert memory.previoustoolcall("other") is None
@@ -0,0 +1,29 @@
+# ~/formalities/tests/utils/test_dialog_errors.py
+from formalities.utils.dialog.state import ErrorType
+from formalities.utils.dialog.patterns import errors
+
+
+def test_component_analysis_shared_by_keywords():
+    first = errors.ErrorAnalyzer.analyzeexception(ValueError("cannot convert 'classical' at 12"), ErrorType.PROPOSITIONINVALID)
+    second = errors.ErrorAnalyzer.analyzeexception(ValueError("cannot convert 'classical' at 40"), ErrorType.PROPOSITIONINVALID)
+    assert first.message != second.message
+    assert first.relatedcomponents and (first.relatedcomponents == second.relatedcomponents)
+    assert (ErrorType.PROPOSITIONINVALID, frozenset({'classical'}), errors.frameworkregistry.generation) in errors.COMPONENTCACHE
+    second.relatedcomponents.clear() # each context gets its own lists
+    assert first.relatedcomponents
+
+def test_cached_analyses_are_copies_holding_no_exception():
+    try:
+        raise ValueError("bad 'classical' value")
+    except ValueError as e:
+        exception = e
+    first = errors.ErrorAnalyzer.analyzeexception(exception, ErrorType.PROPOSITIONINVALID)
+    first.relatedcomponents.clear()
+    first.validationcontext.clear()
+    second = errors.ErrorAnalyzer.analyzeexception(exception, ErrorType.PROPOSITIONINVALID)
+    assert second.relatedcomponents and second.validationcontext
+    assert second.exception is exception and "ValueError" in second.traceback
+    analysis = errors.ErrorContextProvider.geterroranalysis(exception, ErrorType.PROPOSITIONINVALID)
+    analysis["message"] = "changed"
+    assert errors.ErrorContextProvider.geterroranalysis(exception, ErrorType.PROPOSITIONINVALID)["message"] != "changed"
+    assert all(context.exception is None for context in errors.CONTEXTCACHE.values())
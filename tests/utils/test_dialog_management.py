@@ -0,0 +1,16 @@
+# ~/formalities/tests/utils/test_dialog_management.py
+import pytest
+from formalities.utils.dialog import management
+from formalities.utils.dialog.state import DialogState, DialogStage
+
+def test_error_patterns_from_recent_errors():
+    state = DialogState()
+    management.initialize(state)
+    state.seterror(ImportError("missing"))
+    assert management.statemanager.detecterrorpatterns() == []
+    state.transitionto(DialogStage.REASONING)
+    state.seterror(ImportError("missing again"))
+    assert "repeatedimport" in management.statemanager.detecterrorpatterns()
+    assert state.context["broadensuggestions"]
+    state.seterror(TypeError("bad type"))
+    assert "typeafterimport" in management.statemanager.detecterrorpatterns()
@@ -25,6 +25,8 @@ def is_success_with_result(response):
 
 @pytest.fixture(autouse=True)
 def register_validation_strategies():
+    # Discovery is lazy, so discover before snapshotting what to restore
+    frameworkregistry.ensurediscovered()
     # Clear any existing registrations first
     if hasattr(frameworkregistry, '_components'):
         existing = dict(frameworkregistry._components)
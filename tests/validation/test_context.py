@@ -27,6 +27,7 @@ def test_validation_context_recording(classical_framework):
     assert record["proposition"] == str(prop)
     assert record["success"] is True
     assert record["errors"] == []
+    assert isinstance(record["timestamp"], int)
 
 def test_validation_context_child_creation(classical_framework):
     parent = ValidationContext(